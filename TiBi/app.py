@@ -1,3 +1,4 @@
+import os
 import platform
 from PySide6.QtGui import QUndoStack
 from PySide6.QtWidgets import QApplication, QStyleFactory
@@ -60,7 +61,7 @@ class TiBiApplication:
 
         Sets up global models, views, and controllers, and establishes the
         connections between them according to the MVC pattern. Each component
-        is also stored in a dictionary for easy access.
+        is stored as an attribute of the application.
 
         The global models are:
         - project_path: the file to which the dictionary containing the unit
@@ -88,6 +89,11 @@ class TiBiApplication:
         app_controller has access to all the models and controllers
         and is used to direct cross-controller communication
         """
+        # The panels are laid out side by side and never overlap, so Qt
+        # does not need to subtract the regions of opaque siblings when
+        # painting. The variable is read once, so it is set before the
+        # application is created.
+        os.environ.setdefault("QT_NO_SUBTRACTOPAQUESIBLINGS", "1")
         # Create the Qt application
         self.app = QApplication(sys.argv)
         self.app.setStyle(QStyleFactory.create("Fusion"))
@@ -125,14 +131,14 @@ class TiBiApplication:
 
         # Initialize the main window
         self.main_window = MainWindow(
-            self.uc_view,
-            self.uc_plot_view,
-            self.bz_plot_view,
-            self.plot_view,
-            self.computation_view,
-            self.menu_bar,
-            self.toolbar,
-            self.status_bar,
+            uc=self.uc_view,
+            uc_plot=self.uc_plot_view,
+            bz_plot=self.bz_plot_view,
+            plot=self.plot_view,
+            computation_view=self.computation_view,
+            menu_bar=self.menu_bar,
+            toolbar=self.toolbar,
+            status_bar=self.status_bar,
         )
 
         # Initialize contollers
@@ -215,7 +221,9 @@ class TiBiApplication:
         """
         Tasks performed when the app is shut down.
 
-        - Disconnect the undo/redo stack signals
+        - Disconnect the undo/redo stack signals. The stack is destroyed
+        after the actions, and it would otherwise call the tooltip slots
+        on an already deleted C++ object while being torn down.
         """
         self.main_ui_controller.action_manager.disconnect_undo_redo()
 
@@ -1,4 +1,4 @@
-from PySide6.QtCore import QObject
+from PySide6.QtCore import QObject, QTimer, Slot
 import uuid
 
 from .bz_plot_controller import BrillouinZonePlotController
@@ -61,25 +61,58 @@ class AppController(QObject):
         self.uc_controller = uc_controller
         self.uc_plot_controller = uc_plot_controller
 
+        # Redrawing the 3D plots is expensive and a single user action can
+        # request it several times (e.g., a selection reset followed by a
+        # full panel update), while holding an arrow key in the tree
+        # requests it at the keyboard autorepeat rate. A request is drawn
+        # right away and starts a single-shot timer. Requests arriving
+        # while the timer runs are merged into one redraw when it expires,
+        # so that the plots are redrawn at most once per timer interval.
+        # See `set_replot_rate`.
+        self._uc_plot_pending = False
+        self._uc_plot_timer = QTimer(self)
+        self._uc_plot_timer.setSingleShot(True)
+        self._uc_plot_timer.timeout.connect(self._flush_unit_cell_plot)
+
+        self._bz_plot_pending = False
+        self._bz_plot_timer = QTimer(self)
+        self._bz_plot_timer.setSingleShot(True)
+        self._bz_plot_timer.timeout.connect(self._flush_brillouin_zone_plot)
+        self.set_replot_rate(10)
+
+        # The bands and DOS plots share the same axes, which are cleared on
+        # every redraw. Changing the projection or the path can request
+        # several redraws within the same event, so they are merged by a
+        # zero-interval timer and only the last requested plot is drawn.
+        self._pending_plot = None
+        self._plot_timer = QTimer(self)
+        self._plot_timer.setSingleShot(True)
+        self._plot_timer.setInterval(0)
+        self._plot_timer.timeout.connect(self._update_plot)
+
         # Connect signals
         # Redraw the panels only when the unit cell selection changes.
         # Selecting inside the unit cell should not cause redraws.
         self.selection.unit_cell_updated.connect(self._update_panels)
-        # When a new site is selected, reddraw only the unit cell plot
-        self.selection.site_updated.connect(self._update_unit_cell_plot)
+        # When a new site is selected, only the site highlight changes
+        self.selection.site_updated.connect(self._update_site_highlight)
 
         # bz_plot_controller
         # When the path is updated, the bandstructure is cleared.
         # We pass an empty band structure to the plotting function
         # resulting in a cleared plot.
-        self.bz_plot_controller.bz_path_updated.connect(self._plot_bands)
+        self.bz_plot_controller.bz_path_updated.connect(
+            self._request_bands_plot
+        )
 
         # computation_controller
         self.computation_controller.status_updated.connect(self._relay_status)
         self.computation_controller.bands_plot_requested.connect(
-            self._plot_bands
+            self._request_bands_plot
+        )
+        self.computation_controller.dos_plot_requested.connect(
+            self._request_dos_plot
         )
-        self.computation_controller.dos_plot_requested.connect(self._plot_dos)
         # Handle the programmatic selection of an item in the tree
         # due to undo/redo in the hopping controller
         self.computation_controller.selection_requested.connect(
@@ -97,7 +130,7 @@ class AppController(QObject):
             self._handle_project_refresh_requested
         )
         self.main_ui_controller.unit_cell_update_requested.connect(
-            self._update_unit_cell_plot
+            self._request_unit_cell_plot
         )
         # uc_controller
         self.uc_controller.hopping_projection_update_requested.connect(
@@ -106,7 +139,7 @@ class AppController(QObject):
         # If site parameter changes, the change is purely cosmetic,
         # so the only the unit cell plot is redrawn
         self.uc_controller.site_parameter_changed.connect(
-            self._update_unit_cell_plot
+            self._request_unit_cell_plot
         )
         # Unit cell parameter changes typically invalidate
         # derived quantities, requiring a full redraw.
@@ -114,6 +147,20 @@ class AppController(QObject):
             self._update_panels
         )
 
+    def set_replot_rate(self, rate: float):
+        """
+        Set the maximum rate at which the 3D plots are redrawn.
+
+        Parameters
+        ----------
+        rate : float
+            Maximum number of redraws per second
+        """
+        interval = round(1000 / rate)
+        self._uc_plot_timer.setInterval(interval)
+        self._bz_plot_timer.setInterval(interval)
+
+    @Slot(str)
     def _relay_status(self, msg):
         """
         Send a message to the status bar.
@@ -125,6 +172,7 @@ class AppController(QObject):
         """
         self.main_ui_controller.update_status(msg)
 
+    @Slot()
     def _update_panels(self):
         """
         Perform a full redraw of plots and panels.
@@ -148,14 +196,19 @@ class AppController(QObject):
         else:
             self.main_ui_controller.set_spinbox_status(False, False, False)
 
-        # Update the 3D plots for BZ and UC
-        self._update_unit_cell_plot()
-        self.bz_plot_controller.update_brillouin_zone()
+        # Point the plot controllers at the selected unit cell right away,
+        # so that their state matches the panels updated below. Only the
+        # redraw of the 3D plots for BZ and UC is throttled.
+        self.uc_plot_controller.set_unit_cell()
+        self.bz_plot_controller.set_unit_cell()
+        self._request_unit_cell_plot()
+        self._request_brillouin_zone_plot()
 
         # Update the computation panels
         self.computation_controller.update_bands_panel()
         self.computation_controller.update_hopping_panel()
 
+    @Slot()
     def _handle_hopping_segments_requested(self):
         """
         Draw hopping segments connecting the selected state pair.
@@ -165,9 +218,13 @@ class AppController(QObject):
         to draw the lines connecting the source state with the destination
         ones. This approach avoids redrawing the rest of the plot.
         """
+        # A pending redraw draws the segments itself
+        if self._uc_plot_pending:
+            return
         pair_selection = self.computation_controller.get_pair_selection()
         self.uc_plot_controller.update_hopping_segments(pair_selection)
 
+    @Slot()
     def _handle_hopping_projection_update(self):
         """
         Redraw the hopping panels and the projection dropbox.
@@ -180,6 +237,7 @@ class AppController(QObject):
         self.computation_controller.update_hopping_panel()
         self.computation_controller.update_projection_combo()
 
+    @Slot()
     def _handle_project_refresh_requested(self):
         """
         Reset the selection and the tree, and do a full redraw.
@@ -193,11 +251,62 @@ class AppController(QObject):
         self.uc_controller.refresh_tree()
         self._update_panels()
 
+    @Slot()
+    def _request_unit_cell_plot(self):
+        """
+        Redraw the unit cell plot, at most once per timer interval.
+
+        If the plot was not redrawn within the last interval, it is redrawn
+        right away. Otherwise, the request is merged into a single redraw
+        at the end of the interval.
+        """
+        if self._uc_plot_timer.isActive():
+            self._uc_plot_pending = True
+        else:
+            self._update_unit_cell_plot()
+            self._uc_plot_timer.start()
+
+    @Slot()
+    def _request_brillouin_zone_plot(self):
+        """
+        Redraw the Brillouin zone plot, at most once per timer interval.
+
+        If the plot was not redrawn within the last interval, it is redrawn
+        right away. Otherwise, the request is merged into a single redraw
+        at the end of the interval.
+        """
+        if self._bz_plot_timer.isActive():
+            self._bz_plot_pending = True
+        else:
+            self.bz_plot_controller.update_brillouin_zone()
+            self._bz_plot_timer.start()
+
+    @Slot()
+    def _flush_unit_cell_plot(self):
+        """
+        Perform the unit cell redraw requested during the last interval.
+        """
+        if self._uc_plot_pending:
+            self._uc_plot_pending = False
+            self._update_unit_cell_plot()
+            self._uc_plot_timer.start()
+
+    @Slot()
+    def _flush_brillouin_zone_plot(self):
+        """
+        Perform the Brillouin zone redraw requested during the last interval.
+        """
+        if self._bz_plot_pending:
+            self._bz_plot_pending = False
+            self.bz_plot_controller.update_brillouin_zone()
+            self._bz_plot_timer.start()
+
     def _update_unit_cell_plot(self):
         """
         Redraw the unit cell plot.
 
-        Called during the full panels update or when site parameters change.
+        Called through `_request_unit_cell_plot` after a full panels
+        update, a site selection change or a site parameter change.
         """
         n1, n2, n3, wireframe_shown = (
             self.main_ui_controller.get_uc_plot_properties()
@@ -208,6 +317,50 @@ class AppController(QObject):
         if pair_selection[0] is not None and pair_selection[1] is not None:
             self.uc_plot_controller.update_hopping_segments(pair_selection)
 
+    @Slot()
+    def _update_site_highlight(self):
+        """
+        Highlight the newly selected `Site` in the unit cell plot.
+
+        If the sites in the plot are still the ones of the unit cell, the
+        scene is not rebuilt. Otherwise (e.g., the selection changed
+        because a `Site` was added or deleted) a full redraw is requested.
+        """
+        # A pending redraw highlights the selected site itself
+        if self._uc_plot_pending:
+            return
+        if not self.uc_plot_controller.update_site_highlight():
+            self._request_unit_cell_plot()
+
+    @Slot()
+    def _request_bands_plot(self):
+        """
+        Schedule a redraw of the bands plot.
+        """
+        self._pending_plot = "bands"
+        if not self._plot_timer.isActive():
+            self._plot_timer.start()
+
+    @Slot()
+    def _request_dos_plot(self):
+        """
+        Schedule a redraw of the DOS plot.
+        """
+        self._pending_plot = "dos"
+        if not self._plot_timer.isActive():
+            self._plot_timer.start()
+
+    @Slot()
+    def _update_plot(self):
+        """
+        Draw the last requested bands or DOS plot.
+        """
+        pending, self._pending_plot = self._pending_plot, None
+        if pending == "bands":
+            self._plot_bands()
+        elif pending == "dos":
+            self._plot_dos()
+
     def _plot_bands(self):
         """
         Plot the bands for the selected `UnitCell`.
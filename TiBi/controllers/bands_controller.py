@@ -1,5 +1,5 @@
 import numpy as np
-from PySide6.QtCore import QObject, QThread, QTimer, Qt, Signal
+from PySide6.QtCore import QObject, QThread, QTimer, Qt, Signal, Slot
 import uuid
 
 from TiBi.core import get_BZ_grid, interpolate_k_path
@@ -54,15 +54,13 @@ class BandsController(QObject):
         self.unit_cells = unit_cells
         self.selection = selection
         self.bands_panel = bands_panel
+        # Whether a diagonalization thread is currently running
+        self._computation_running = False
         # Conenct the signals
         self.bands_panel.compute_bands_btn.clicked.connect(self._compute_bands)
         self.bands_panel.compute_grid_btn.clicked.connect(self._compute_grid)
         self.bands_panel.proj_combo.selection_changed.connect(
-            lambda _: (
-                self.bands_plot_requested.emit()
-                if (self.bands_panel.radio_group.checkedId() == 0)
-                else self.dos_plot_requested.emit()
-            )
+            self._request_plot
         )
         self.bands_panel.select_all_btn.clicked.connect(
             self.bands_panel.proj_combo.select_all
@@ -72,41 +70,19 @@ class BandsController(QObject):
         )
         # Toggle whether to show bands or DOS:
         self.bands_panel.radio_group.buttonToggled.connect(
-            lambda _, checked: (
-                (
-                    self.bands_plot_requested.emit()
-                    if (self.bands_panel.radio_group.checkedId() == 0)
-                    else self.dos_plot_requested.emit()
-                )
-                if checked
-                else None
-            )
+            lambda _, checked: self._request_plot() if checked else None
         )
         # Toggle between Histogram and Lorentzian.
         # Only trigger if DOS is selected
         self.bands_panel.presentation_choice_group.buttonToggled.connect(
-            lambda _, checked: (
-                self.dos_plot_requested.emit()
-                if (
-                    checked and (self.bands_panel.radio_group.checkedId() == 1)
-                )
-                else None
-            )
+            lambda _, checked: self._request_dos_plot() if checked else None
         )
         # Trigger plots when changing broadening or bin number
         self.bands_panel.broadening_spinbox.editingConfirmed.connect(
-            lambda: (
-                None
-                if (self.bands_panel.radio_group.checkedId() == 0)
-                else self.dos_plot_requested.emit()
-            )
+            self._request_dos_plot
         )
         self.bands_panel.num_bins_spinbox.editingConfirmed.connect(
-            lambda: (
-                None
-                if (self.bands_panel.radio_group.checkedId() == 0)
-                else self.dos_plot_requested.emit()
-            )
+            self._request_dos_plot
         )
         # Update the approximate output sizes
         self.bands_panel.n_points_spinbox.valueChanged.connect(
@@ -121,32 +97,64 @@ class BandsController(QObject):
         self.bands_panel.v3_points_spinbox.valueChanged.connect(
             self._set_approximate_BZ_output
         )
-        self.selection.selection_changed.connect(
-            self._set_approximate_band_output
-        )
+        self.selection.selection_changed.connect(self._set_approximate_outputs)
 
-        self.selection.selection_changed.connect(
-            self._set_approximate_BZ_output
-        )
+    @Slot()
+    def _set_approximate_outputs(self):
+        """
+        Update both approximate output size labels.
+
+        A single receiver for the selection change, so that one emission
+        updates both estimates.
+        """
+        self._set_approximate_band_output()
+        self._set_approximate_BZ_output()
+
+    @Slot()
+    def _request_plot(self):
+        """
+        Request the bands or the DOS plot, depending on the chosen output.
+        """
+        if self.bands_panel.radio_group.checkedId() == 0:
+            self.bands_plot_requested.emit()
+        else:
+            self.dos_plot_requested.emit()
 
+    @Slot()
+    def _request_dos_plot(self):
+        """
+        Request the DOS plot if the DOS output is chosen.
+        """
+        if self.bands_panel.radio_group.checkedId() == 1:
+            self.dos_plot_requested.emit()
+
+    def _estimate_output_size(self, n_pts: int) -> int:
+        """
+        Estimate the size in bytes of the results for a number of k-points.
+
+        Only the number of states in the selected `UnitCell` is needed, so
+        the states are counted without building the full state list.
+        """
+        if not self.selection.unit_cell:
+            return 0
+        unit_cell = self.unit_cells[self.selection.unit_cell]
+        n_states = sum(len(site.states) for site in unit_cell.sites.values())
+        # The multiplication by 10 is due to JSON overhead
+        # (not being binary)
+        return n_pts * (16 * n_states**2 + 8 * n_states) * 10
+
+    @Slot(int)
     def _set_approximate_band_output(self, _=None):
         """
         Update the approximate output size label.
         """
         n_pts = self.bands_panel.n_points_spinbox.value()
-        if self.selection.unit_cell:
-            n_states = len(
-                self.unit_cells[self.selection.unit_cell].get_states()[0]
-            )
-            # The multiplication by 10 is due to JSON overhead
-            # (not being binary)
-            res = n_pts * (16 * n_states**2 + 8 * n_states) * 10
-        else:
-            res = 0
+        res = self._estimate_output_size(n_pts)
         self.bands_panel.approximate_band_size.setText(
             f"Approximate output size: {res // 1000} kB"
         )
 
+    @Slot(int)
     def _set_approximate_BZ_output(self, _=None):
         """
         Update the approximate output size label.
@@ -168,25 +176,21 @@ class BandsController(QObject):
             n_pts = 0
         else:
             n_pts = np.prod(n_pts)
-        if self.selection.unit_cell:
-            n_states = len(
-                self.unit_cells[self.selection.unit_cell].get_states()[0]
-            )
-            # The multiplication by 10 is due to JSON overhead
-            # (not being binary)
-            res = n_pts * (16 * n_states**2 + 8 * n_states) * 10
-        else:
-            res = 0
+        res = self._estimate_output_size(n_pts)
         self.bands_panel.approximate_BZ_grid_size.setText(
             f"Approximate output size: {res // 1000} kB"
         )
 
+    @Slot()
     def _compute_bands(self):
         """
         Calculate the electronic band structure along a specified k-path.
 
         The path is defined by the special points in the Brillouin zone.
         """
+        # Only one computation is allowed at a time
+        if self._computation_running:
+            return
         # Set the radio toggle to the correct option
         for b in self.bands_panel.radio_group.buttons():
             b.blockSignals(True)
@@ -218,12 +222,34 @@ class BandsController(QObject):
         )
 
         # Perform calculation on a separate thread
-        self.worker = DiagonalizationWorker(hamiltonian_func, k_path)
+        self._start_diagonalization(
+            hamiltonian_func, k_path, self._handle_band_results
+        )
+
+    def _start_diagonalization(self, hamiltonian_func, k_points, handler):
+        """
+        Diagonalize the Hamiltonian at the k-points on a separate thread.
+
+        A progress dialog is shown if the calculation takes longer than
+        a short delay. While the calculation runs, further computation
+        requests are ignored.
+
+        Parameters
+        ----------
+        hamiltonian_func : callable
+            Function returning the Hamiltonian matrices for the k-points
+        k_points : NDArray[np.float64]
+            Array of k-points, one point per row
+        handler : callable
+            Slot receiving the results of the calculation
+        """
+        self._computation_running = True
+        self.worker = DiagonalizationWorker(hamiltonian_func, k_points)
         self.thread = QThread()
 
         self.worker.moveToThread(self.thread)
         self.thread.started.connect(self.worker.do_work)
-        self.worker.task_finished.connect(self._handle_band_results)
+        self.worker.task_finished.connect(handler)
 
         self.dialog = ProgressDialog()
         self.worker.progress_updated.connect(self.dialog.update_progress)
@@ -252,7 +278,16 @@ class BandsController(QObject):
 
         # Wait for the thread to finish and kill the timer if needed
         self.thread.finished.connect(self._show_timer.stop)
+        self.thread.finished.connect(self._finish_diagonalization)
 
+    @Slot()
+    def _finish_diagonalization(self):
+        """
+        Allow new computations once the diagonalization thread has stopped.
+        """
+        self._computation_running = False
+
+    @Slot(object)
     def _handle_band_results(self, res):
         """
         Handle the results of the band structure calculation.
@@ -271,14 +306,18 @@ class BandsController(QObject):
         eigenvalues, eigenvectors, k_path = res
         unit_cell.bandstructure.eigenvalues = eigenvalues
         unit_cell.bandstructure.eigenvectors = eigenvectors
-        unit_cell.bandstructure.path = k_path
+        unit_cell.bandstructure.path = list(k_path)
         # Update combo to make sure all sites are selected
         self.update_combo()
 
+    @Slot()
     def _compute_grid(self):
         """
         Calculate the BZ grid using the settings from the panel.
         """
+        # Only one computation is allowed at a time
+        if self._computation_running:
+            return
         # Set the radio toggle to the correct option
         for b in self.bands_panel.radio_group.buttons():
             b.blockSignals(True)
@@ -312,41 +351,11 @@ class BandsController(QObject):
 
         self.status_updated.emit("Computing the grid")
         # Perform calculation on a separate thread
-        self.worker = DiagonalizationWorker(hamiltonian_func, k_points)
-        self.thread = QThread()
-
-        self.worker.moveToThread(self.thread)
-        self.thread.started.connect(self.worker.do_work)
-        self.worker.task_finished.connect(self._handle_grid_results)
-
-        self.dialog = ProgressDialog()
-        self.worker.progress_updated.connect(self.dialog.update_progress)
-        self.worker.task_finished.connect(self.dialog.accept)
-        self.worker.task_aborted.connect(self.dialog.reject)
-        self.dialog.cancel_requested.connect(
-            self.worker.request_abort, Qt.DirectConnection
+        self._start_diagonalization(
+            hamiltonian_func, k_points, self._handle_grid_results
         )
 
-        # Cleanup
-        self.worker.task_finished.connect(self.thread.quit)
-        self.worker.task_aborted.connect(self.thread.quit)
-        self.thread.finished.connect(self.thread.deleteLater)
-
-        self.thread.start()
-        # Only show the dialog after a delay if it's still running
-        self._show_timer = QTimer(self)
-        self._show_timer.setSingleShot(True)
-
-        def maybe_show_dialog():
-            if self.thread.isRunning():
-                self.dialog.show()
-
-        self._show_timer.timeout.connect(maybe_show_dialog)
-        self._show_timer.start(150)  # Delay in ms
-
-        # Wait for the thread to finish and kill the timer if needed
-        self.thread.finished.connect(self._show_timer.stop)
-
+    @Slot(object)
     def _handle_grid_results(self, res):
         """
         Handle the results of the BZ grid calculation.
@@ -440,15 +449,10 @@ class BandsController(QObject):
             self.bands_panel.compute_bands_btn.setEnabled(False)
 
         else:
-            self.bands_panel.remove_last_btn.setEnabled(
-                len(unit_cell.bandstructure.special_points) > 0
-            )
-            self.bands_panel.clear_path_btn.setEnabled(
-                len(unit_cell.bandstructure.special_points) > 0
-            )
-            self.bands_panel.compute_bands_btn.setEnabled(
-                len(unit_cell.bandstructure.special_points) > 1
-            )
+            n_points = len(unit_cell.bandstructure.special_points)
+            self.bands_panel.remove_last_btn.setEnabled(n_points > 0)
+            self.bands_panel.clear_path_btn.setEnabled(n_points > 0)
+            self.bands_panel.compute_bands_btn.setEnabled(n_points > 1)
 
         # BZ grid spinboxes
         self.bands_panel.v1_points_spinbox.setEnabled(dim > 0)
@@ -473,8 +477,8 @@ class BandsController(QObject):
         Update the states in the combo box.
 
         Once the items are updated, the selection buttons are activated
-        if the number of items is not zero. Additionally, all the items
-        are selected programatically.
+        if the number of items is not zero. The refreshed items are all
+        selected, and the combo box announces the new selection once.
         """
         uc_id = self.selection.unit_cell
         if uc_id is None:
@@ -482,11 +486,10 @@ class BandsController(QObject):
         else:
             unit_cell = self.unit_cells[uc_id]
             _, state_info = unit_cell.get_states()
-            items = [f"{s[0]}.{s[2]}" for s in state_info]
+            items = [f"{s.site_name}.{s.state_name}" for s in state_info]
         self.bands_panel.proj_combo.refresh_combo(items)
         self.bands_panel.select_all_btn.setEnabled(len(items) > 0)
         self.bands_panel.clear_all_btn.setEnabled(len(items) > 0)
-        self.bands_panel.proj_combo.select_all()
 
     def get_projection_indices(self):
         """
@@ -1,7 +1,7 @@
 import numpy as np
 from numpy.typing import NDArray
 import pyqtgraph.opengl as gl
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QTimer, Signal, Slot
 from PySide6.QtGui import QUndoStack
 import uuid
 
@@ -52,6 +52,9 @@ class BrillouinZonePlotController(QObject):
         Indices of the selected high-symmetry points in the BZ
     bz_point_lists : dict
         Lists of high-symmetry points, grouped by type
+    plot_outdated : bool
+        Whether the plot still shows the state from before the last
+        `set_unit_cell` call
     bz_path_updated : Signal
         Emitted when the BZ special points path is updated
         by adding or removing points. Triggers a redraw of
@@ -59,6 +62,8 @@ class BrillouinZonePlotController(QObject):
 
     Methods
     -------
+    set_unit_cell()
+        Load the selected `UnitCell` and its high-symmetry points.
     update_brillouin_zone()
         Draw the Brillouin zone of the selected `UnitCell`.
     """
@@ -89,8 +94,17 @@ class BrillouinZonePlotController(QObject):
         self.bz_point_selection = bz_point_selection_init()
         # Lists of high-symmetry points, grouped by type
         self.bz_point_lists = bz_point_lists_init()
-
-        self.bz_path_updated.connect(self._update_path_visualization)
+        # Whether the plot lags behind the loaded unit cell
+        self.plot_outdated = False
+
+        # Path edits arriving in a burst (e.g., holding the undo shortcut)
+        # are merged into a single redraw of the path once control returns
+        # to the event loop
+        self._path_timer = QTimer(self)
+        self._path_timer.setSingleShot(True)
+        self._path_timer.setInterval(0)
+        self._path_timer.timeout.connect(self._update_path_visualization)
+        self.bz_path_updated.connect(self._request_path_visualization)
 
         # Signals from the ComputationView used for selecting/picking
         # high-symmetry points in the BZ
@@ -134,26 +148,16 @@ class BrillouinZonePlotController(QObject):
             self._clear_path
         )
 
-    def update_brillouin_zone(self):
+    def set_unit_cell(self):
         """
-        Draw the Brillouin zone of the selected `UnitCell`.
-
-        This method is the core rendering function that:
-        1. Clears any existing visualization
-        2. Calculates the Brillouin zone vertices and faces
-        3. Renders the BZ wireframe and key points (Gamma, vertices,
-        edge midpoints, face centers)
-        4. Updates UI controls based on the dimensionality of the BZ
+        Load the selected `UnitCell` and its high-symmetry points.
 
-        The method is triggered whenever the `UnitCell` changes or
-        a new unit cell is selected.
+        The state used by the path buttons (the `UnitCell`, the lists of
+        high-symmetry points and the selected points) is updated here,
+        so that it always follows the selection. The plot itself is
+        redrawn separately by `update_brillouin_zone`.
         """
         uc_id = self.selection.unit_cell
-        # Clear previous plot items except axes
-        for key, item in list(self.bz_plot_items.items()):
-            self.bz_plot_view.view.removeItem(item)
-            del self.bz_plot_items[key]
-
         # Indices of the selected high-symmetry points in the BZ
         # The key is the type of the high symmetry point
         # ("face", "edge", "vertex")
@@ -164,8 +168,12 @@ class BrillouinZonePlotController(QObject):
         # ("face", "edge", "vertex")
         # The values are arrays of length-3 arrays of coordinates
         self.bz_point_lists = bz_point_lists_init()
+        self.bz_vertices, self.bz_faces = [], []
+        self.plot_outdated = True
 
         if uc_id is None:
+            # Release the previous unit cell so a deleted one can be freed
+            self.unit_cell = None
             return
         else:
             self.unit_cell = self.unit_cells[uc_id]
@@ -219,6 +227,34 @@ class BrillouinZonePlotController(QObject):
             self.bz_point_lists["edge"] = np.array(edge_midpoints)
             self.bz_point_lists["face"] = np.array(self.bz_point_lists["face"])
 
+        # Select the 1st point of each type
+        for typ, pt in self.bz_point_lists.items():
+            if len(pt) > 0:
+                self.bz_point_selection[typ] = 0
+
+    @Slot()
+    def update_brillouin_zone(self):
+        """
+        Draw the Brillouin zone of the selected `UnitCell`.
+
+        This method is the core rendering function that:
+        1. Clears any existing visualization
+        2. Renders the BZ wireframe and key points (Gamma, vertices,
+        edge midpoints, face centers) loaded by `set_unit_cell`
+        3. Highlights the selected point of each type
+
+        The method is triggered whenever the `UnitCell` changes or
+        a new unit cell is selected.
+        """
+        # Clear previous plot items except axes
+        for key, item in list(self.bz_plot_items.items()):
+            self.bz_plot_view.view.removeItem(item)
+            del self.bz_plot_items[key]
+        self.plot_outdated = False
+
+        if self.unit_cell is None or self.unit_cell.volume() == 0:
+            return
+
         # Draw the path
         self._update_path_visualization()
         # Create the BZ wireframe by making edges
@@ -238,8 +274,6 @@ class BrillouinZonePlotController(QObject):
             if len(pt) > 0:
                 # Pad all the points of the same type
                 pt_3d = self._pad_to_3d(pt)
-                # Select the 1st point of the type
-                self.bz_point_selection[typ] = 0
                 # Loop over all the padded points
                 for ii, p in enumerate(pt_3d):
                     # Make a sphere and position it
@@ -248,8 +282,8 @@ class BrillouinZonePlotController(QObject):
                     sphere.translate(p[0], p[1], p[2])
                     self.bz_plot_view.view.addItem(sphere)
                     self.bz_plot_items[f"bz_{typ}_{ii}"] = sphere
-                    # Highlight the first point
-                    if ii == 0:
+                    # Highlight the selected point
+                    if ii == self.bz_point_selection[typ]:
                         sphere.setColor(self.bz_plot_view.selected_point_color)
 
     def _create_bz_wireframe(self):
@@ -350,6 +384,11 @@ class BrillouinZonePlotController(QObject):
             self.bz_point_selection[typ] = (prev_point + step) % len(
                 self.bz_point_lists[typ]
             )
+        # While a redraw is pending, the spheres in the plot do not match
+        # the point lists. The redraw highlights the selected point itself.
+        if self.plot_outdated:
+            return
+        if prev_point is not None:
             prev_key = f"bz_{typ}_{prev_point}"
             self.bz_plot_items[prev_key].setColor(
                 self.bz_plot_view.point_color
@@ -387,7 +426,8 @@ class BrillouinZonePlotController(QObject):
                     self.bz_point_lists[point][self.bz_point_selection[point]]
                 )
             else:
-                print("No point selected")
+                # No point of this type is selected, so there is nothing
+                # to add. The buttons are disabled in this case anyway.
                 return
         self.undo_stack.push(
             AddBZPointCommand(
@@ -398,6 +438,7 @@ class BrillouinZonePlotController(QObject):
             )
         )
 
+    @Slot()
     def _remove_last_point(self):
         """Remove the last point added to the path."""
         self.undo_stack.push(
@@ -408,6 +449,7 @@ class BrillouinZonePlotController(QObject):
             )
         )
 
+    @Slot()
     def _clear_path(self):
         """Remove all points from the path."""
         self.undo_stack.push(
@@ -418,6 +460,15 @@ class BrillouinZonePlotController(QObject):
             )
         )
 
+    @Slot()
+    def _request_path_visualization(self):
+        """
+        Schedule a redraw of the BZ path.
+        """
+        if not self._path_timer.isActive():
+            self._path_timer.start()
+
+    @Slot()
     def _update_path_visualization(self):
         """
         Update the visualization of the BZ path based on current path points.
@@ -429,13 +480,20 @@ class BrillouinZonePlotController(QObject):
         the band structure will be calculated.
 
         If the path has fewer than 2 points, no visualization is created.
+        While a redraw of the plot is pending, the path is left to
+        `update_brillouin_zone`.
         """
+        if self.plot_outdated:
+            return
         # Remove existing path visualization if it exists
         if "bz_path" in self.bz_plot_items:
             self.bz_plot_view.view.removeItem(self.bz_plot_items["bz_path"])
             del self.bz_plot_items["bz_path"]
         # Only create visualization if we have at least 2 points
-        if len(self.unit_cell.bandstructure.special_points) < 2:
+        if (
+            self.unit_cell is None
+            or len(self.unit_cell.bandstructure.special_points) < 2
+        ):
             return
 
         # Convert path points to 3D if needed
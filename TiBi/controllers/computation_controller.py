@@ -110,9 +110,8 @@ class ComputationController(QObject):
 
         Returns
         -------
-        list[tuple]  | list[None]
-            List of selected states, if available, where the elements of
-            the list are (site_name, site_id, state_name, state_id).
+        list[StateRef] | list[None]
+            List of selected states, if available.
         """
         return self.hopping_controller.pair_selection
 
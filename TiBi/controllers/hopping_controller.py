@@ -1,16 +1,11 @@
 import numpy as np
-from PySide6.QtCore import QObject, Qt, QPoint, Signal
+from PySide6.QtCore import QObject, Qt, QPoint, Signal, Slot
 from PySide6.QtGui import QAction, QUndoStack
 from PySide6.QtWidgets import QDoubleSpinBox, QMenu, QPushButton, QSpinBox
 import uuid
 
 from TiBi.logic.commands import SaveHoppingsCommand
 from TiBi.models import Selection, UnitCell
-from TiBi.ui.styles import (
-    BUTTON_STYLE_DEFAULT,
-    BUTTON_STYLE_HAS_HOPPING,
-    BUTTON_STYLE_NONHERMITIAN,
-)
 from TiBi.ui.utilities import set_button_size
 from TiBi.views.panels import HoppingPanel
 
@@ -38,12 +33,10 @@ class HoppingController(QObject):
         The main view component
     undo_stack : QUndoStack
         `QUndoStack` to hold "undo-able" commands
-    state_info : list[tuple]
-        List of tuples with state information \
-        (site_name, site_id, state_name, state_id)\
-        for each `State` in the `UnitCell`
-    pair_selection : list[tuple]
-        2-element list of tuples containing the selected state pair
+    state_info : list[StateRef]
+        List of references to each `State` in the `UnitCell`
+    pair_selection : list[StateRef] | list[None]
+        2-element list containing the selected state pair
     hoppings : dict[tuple[uuid, uuid],\
             list[tuple[tuple[int, int, int], np.complex128]]]
         Dictionary containing the hopping parameters for the `UnitCell`.
@@ -51,9 +44,8 @@ class HoppingController(QObject):
         Each hopping is a tuple of a displacement tuple, given in
         terms of lattice vectors, and a complex amplitude.
     btn_clicked : Signal(object, object)
-        Emitted when a hopping button is clicked. The Signal carries the source
-        and destination state info following the
-        (site_name, site_id, state_name, state_id) format.
+        Emitted when a hopping button is clicked. The Signal carries the
+        `StateRef`s of the destination and source states.
     hoppings_changed : Signal(object, object, object, object, object)
         Emitted by the command when couplings are modified.
         The signal carries the information about the current item selection,
@@ -183,8 +175,12 @@ class HoppingController(QObject):
                 state2 = self.state_info[jj]
                 # Apply button styles
 
-                hop = set(self.hoppings.get((state1[3], state2[3]), []))
-                hop_herm = set(self.hoppings.get((state2[3], state1[3]), []))
+                hop = set(
+                    self.hoppings.get((state1.state_id, state2.state_id), [])
+                )
+                hop_herm = set(
+                    self.hoppings.get((state2.state_id, state1.state_id), [])
+                )
                 has_hopping = bool(hop)
                 hop_neg_conj = set(
                     ((-d1, -d2, -d3), np.conj(x)) for ((d1, d2, d3), x) in hop
@@ -198,10 +194,12 @@ class HoppingController(QObject):
                 # row (columns multiply annihilation operators,
                 # rows multiply creation)
                 btn.setToolTip(
-                    f"{state2[0]}.{state2[2]} → {state1[0]}.{state1[2]}"
+                    f"{state2.site_name}.{state2.state_name} → "
+                    f"{state1.site_name}.{state1.state_name}"
                 )
                 btn.setStatusTip(
-                    f"{state2[0]}.{state2[2]} → {state1[0]}.{state1[2]}"
+                    f"{state2.site_name}.{state2.state_name} → "
+                    f"{state1.site_name}.{state1.state_name}"
                 )
 
                 # Button click handler implementation:
@@ -224,6 +222,9 @@ class HoppingController(QObject):
         """
         Apply the appropriate style to a button based on its hoppings.
 
+        The colors are defined in the style sheet of the matrix panel and
+        are selected through the "hopping" dynamic property of the button.
+
         Parameters
         ----------
         button : QPushButton
@@ -234,25 +235,29 @@ class HoppingController(QObject):
             Boolean indicating whether the coupling is Hermitian
         """
         if not has_hopping:
-            style = BUTTON_STYLE_DEFAULT
+            style = "none"
         else:
             if hermitian:
-                style = BUTTON_STYLE_HAS_HOPPING
+                style = "hermitian"
             else:
-                style = BUTTON_STYLE_NONHERMITIAN
+                style = "nonhermitian"
 
-        button.setStyleSheet(style)
+        button.setProperty("hopping", style)
+        # Re-polish in case the button has already been styled
+        button.style().unpolish(button)
+        button.style().polish(button)
 
+    @Slot(object, object)
     def _update_pair_selection(self, s1, s2):
         """
         Update the pair selection and the table to display hopping terms.
 
         Parameters
         ----------
-        s1 : tuple[str, uuid.UUID, str, uuid.UUID] | None
-            Information tuple for the destination `State` (row)
-        s2 : tuple[str, uuid.UUID, str, uuid.UUID] | None
-            Information tuple for the source `State` (column)
+        s1 : StateRef | None
+            Reference to the destination `State` (row)
+        s2 : StateRef | None
+            Reference to the source `State` (column)
         """
 
         # Store the UUIDs of the selected states
@@ -269,7 +274,8 @@ class HoppingController(QObject):
             # Update the table title to show the selected states
             # (source → destination)
             self.hopping_view.table_panel.table_title.setText(
-                f"{s2[0]}.{s2[2]} → {s1[0]}.{s1[2]}"
+                f"{s2.site_name}.{s2.state_name} → "
+                f"{s1.site_name}.{s1.state_name}"
             )
             self._refresh_table()
 
@@ -279,7 +285,11 @@ class HoppingController(QObject):
             0
         )  # Clear existing data
         for (d1, d2, d3), amplitude in self.hoppings.get(
-            (self.pair_selection[0][3], self.pair_selection[1][3]), []
+            (
+                self.pair_selection[0].state_id,
+                self.pair_selection[1].state_id,
+            ),
+            [],
         ):
             row_index = self.hopping_view.table_panel.hopping_table.rowCount()
             self.hopping_view.table_panel.hopping_table.insertRow(row_index)
@@ -330,6 +340,7 @@ class HoppingController(QObject):
 
         return box
 
+    @Slot()
     def _add_empty_row(self):
         """Add a new empty row to the table"""
         row_index = self.hopping_view.table_panel.hopping_table.rowCount()
@@ -352,6 +363,7 @@ class HoppingController(QObject):
             row_index, 4, self._make_doublespinbox()
         )
 
+    @Slot()
     def _remove_selected_coupling(self):
         """Remove selected row(s) from the table"""
         selected_rows = set()
@@ -373,6 +385,7 @@ class HoppingController(QObject):
         for row in sorted(selected_rows, reverse=True):
             self.hopping_view.table_panel.hopping_table.removeRow(row)
 
+    @Slot()
     def _save_couplings(self):
         """
         Extract data from the hopping table and save it to the `UnitCell`.
@@ -422,7 +435,11 @@ class HoppingController(QObject):
         # Only update the model if the hoppings have changed
         if set(merged_couplings) == set(
             self.unit_cells[self.selection.unit_cell].hoppings.get(
-                (self.pair_selection[0][3], self.pair_selection[1][3]), []
+                (
+                    self.pair_selection[0].state_id,
+                    self.pair_selection[1].state_id,
+                ),
+                [],
             )
         ):
             # No changes detected, just refresh the table in case the user
@@ -495,7 +512,7 @@ class HoppingController(QObject):
         """
         s1 = self.state_info[ii]  # Destination
         s2 = self.state_info[jj]  # Source
-        hop = self.hoppings.get((s1[3], s2[3]), [])
+        hop = self.hoppings.get((s1.state_id, s2.state_id), [])
         hop_herm = [((-d1, -d2, -d3), np.conj(x)) for ((d1, d2, d3), x) in hop]
         self.pair_selection = [s2, s1]
 
@@ -535,6 +552,7 @@ class HoppingController(QObject):
             )
         )
 
+    @Slot(object, object, object, object, object)
     def _handle_hoppings_changed(self, uc_id, site_id, state_id, s1, s2):
         """
         Redraw the matrix and table when hoppings are modified.
@@ -552,10 +570,10 @@ class HoppingController(QObject):
             UUID of the site
         state_id : uuid.UUID
             UUID of the state
-        s1 : tuple[str, uuid.UUID, str, uuid.UUID]
-            Information tuple for the destination `State` (row)
-        s2 : tuple[str, uuid.UUID, str, uuid.UUID]
-            Information tuple for the source `State` (column)
+        s1 : StateRef
+            Reference to the destination `State` (row)
+        s2 : StateRef
+            Reference to the source `State` (column)
         """
         # If the unit cell selection needs to change, matrix redrawing
         # will be handled by the app controller as all panels are updated
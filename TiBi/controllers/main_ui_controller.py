@@ -100,13 +100,13 @@ class MainUIController(QObject):
 
         # Connect spinbox signals
         self.toolbar.n1_spinbox.valueChanged.connect(
-            lambda _: self.unit_cell_update_requested.emit()
+            self.unit_cell_update_requested
         )
         self.toolbar.n2_spinbox.valueChanged.connect(
-            lambda _: self.unit_cell_update_requested.emit()
+            self.unit_cell_update_requested
         )
         self.toolbar.n3_spinbox.valueChanged.connect(
-            lambda _: self.unit_cell_update_requested.emit()
+            self.unit_cell_update_requested
         )
 
     def _connect_action_handlers(self):
@@ -113,13 +113,19 @@ class PlotController(QObject):
                         alpha=0.6,
                     )
 
-                # Plot vertical lines at special points
-                for x in pos_special_points:
-                    self.plot_view.ax.axvline(
-                        x=x, color="gray", linestyle="--", linewidth=0.8
-                    )
+                # Plot vertical lines at special points as a single
+                # collection spanning the full height of the axes
+                self.plot_view.ax.vlines(
+                    pos_special_points,
+                    0,
+                    1,
+                    transform=self.plot_view.ax.get_xaxis_transform(),
+                    colors="gray",
+                    linestyles="--",
+                    linewidth=0.8,
+                )
             # Draw the canvas
-            self.plot_view.canvas.draw()
+            self.plot_view.request_repaint()
 
     def plot_dos(self, num_bins, states, plot_type, broadening):
         """
@@ -196,4 +202,4 @@ class PlotController(QObject):
                 )
 
             # Draw the canvas
-            self.plot_view.canvas.draw()
+            self.plot_view.request_repaint()
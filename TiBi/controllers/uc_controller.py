@@ -1,4 +1,4 @@
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, Slot
 from PySide6.QtGui import QColor, QUndoStack
 from PySide6.QtWidgets import QColorDialog
 import uuid
@@ -106,6 +106,9 @@ class UnitCellController(QObject):
         self.tree_view = self.tree_view_panel.tree_view
         self.tree_model = self.tree_view.tree_model
 
+        # (unit cell, site) pair currently shown in the panels
+        self._shown_selection = (None, None)
+
         # Rebuild the tree view from scratch in the beginning
         self.tree_view.refresh_tree(self.unit_cells)
 
@@ -115,11 +118,7 @@ class UnitCellController(QObject):
 
         # Tree view signals
         # When the tree selection changes, the selection model is updated
-        self.tree_view.tree_selection_changed.connect(
-            lambda x: self.selection.set_selection(
-                uc_id=x["unit_cell"], site_id=x["site"], state_id=x["state"]
-            )
-        )
+        self.tree_view.tree_selection_changed.connect(self._set_tree_selection)
 
         # Triggered when a tree item's name is changed by double clicking on it
         self.tree_view_panel.name_edit_finished.connect(
@@ -280,6 +279,23 @@ class UnitCellController(QObject):
             self._pick_site_color
         )
 
+    @Slot(object)
+    def _set_tree_selection(self, tree_selection):
+        """
+        Update the selection model with the IDs selected in the tree.
+
+        Parameters
+        ----------
+        tree_selection : dict[str, uuid.UUID | None]
+            Dictionary with the selected `UnitCell`, `Site`, and `State` IDs.
+        """
+        self.selection.set_selection(
+            uc_id=tree_selection["unit_cell"],
+            site_id=tree_selection["site"],
+            state_id=tree_selection["state"],
+        )
+
+    @Slot()
     def _show_panels(self):
         """
         Update the UI panels based on the current selection state.
@@ -300,6 +316,12 @@ class UnitCellController(QObject):
         """
         unit_cell_id = self.selection.unit_cell
         site_id = self.selection.site
+        # The panels only depend on the selected unit cell and site.
+        # If only the state selection changed, there is nothing to update.
+        if (unit_cell_id, site_id) == self._shown_selection:
+            return
+        self._shown_selection = (unit_cell_id, site_id)
+
         if unit_cell_id:
             # Get the selected unit cell
             uc = self.unit_cells[unit_cell_id]
@@ -381,6 +403,7 @@ class UnitCellController(QObject):
                 self.unit_cell_view.site_info_label
             )
 
+    @Slot()
     def _pick_site_color(self):
         """
         Open a color dialog to select a color for the selected site.
@@ -424,6 +447,7 @@ class UnitCellController(QObject):
         """
         self.tree_view.refresh_tree(self.unit_cells)
 
+    @Slot(object, object, object)
     def select_item(self, uc_id, site_id, state_id):
         """
         Select a tree item using the ID's.
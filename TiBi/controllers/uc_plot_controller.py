@@ -32,12 +32,14 @@ class UnitCellPlotController(QObject):
 
     Methods
     -------
-    update_hopping_segments(pair_selection: \
-        tuple[tuple[str, uuid.UUID, str, uuid.UUID],\
-            tuple[str, uuid.UUID, str, uuid.UUID]])
+    set_unit_cell()
+        Load the selected `UnitCell`.
+    update_hopping_segments(pair_selection: list[StateRef])
         Draw segments to indicate hopping connections.
     update_unit_cell(wireframe_shown: bool, n1: int, n2: int, n3: int)
         Draw the selected `UnitCell` in the 3D view.
+    update_site_highlight() -> bool
+        Highlight the selected `Site` without redrawing the plot.
     """
 
     def __init__(
@@ -54,6 +56,21 @@ class UnitCellPlotController(QObject):
         # Internal controller state
         self.unit_cell = None  # Unit cell being plotted
         self.uc_plot_items = {}  # Dictionary to store plot items
+        self.highlighted_site = None  # Site drawn as selected
+        self.plotted_sites = set()  # IDs of the sites present in the plot
+        self.n1, self.n2, self.n3 = 1, 1, 1  # Repetitions of the unit cell
+
+    def set_unit_cell(self):
+        """
+        Load the selected `UnitCell`.
+
+        The plotted `UnitCell` follows the selection immediately, while the
+        plot itself is redrawn separately by `update_unit_cell`. Dropping
+        the reference to the previous unit cell allows a deleted one
+        to be freed.
+        """
+        uc_id = self.selection.unit_cell
+        self.unit_cell = None if uc_id is None else self.unit_cells[uc_id]
 
     def update_unit_cell(
         self, wireframe_shown: bool, n1: int, n2: int, n3: int
@@ -68,16 +85,17 @@ class UnitCellPlotController(QObject):
         n1, n2, n3 : int
             Number of repetitions along the corresponding basis vector
         """
-        uc_id = self.selection.unit_cell
         # Clear previous plot items except axes
         for key, item in list(self.uc_plot_items.items()):
             self.uc_plot_view.view.removeItem(item)
             del self.uc_plot_items[key]
         # Early exit if no unit cell selected
-        if uc_id is None:
+        if self.unit_cell is None:
+            self.plotted_sites = set()
             return
 
-        self.unit_cell = self.unit_cells[uc_id]
+        self.highlighted_site = self.selection.site
+        self.plotted_sites = set(self.unit_cell.sites)
         self.n1, self.n2, self.n3 = n1, n2, n3
 
         # Collect line vertices
@@ -105,10 +123,8 @@ class UnitCellPlotController(QObject):
 
         # Shift the unit cells so that they are centered around the origin
         shift = (
-            -(
-                self.n1 * self.unit_cell.v1.as_array()
-                + self.n2 * self.unit_cell.v2.as_array()
-                + self.n3 * self.unit_cell.v3.as_array()
+            -np.dot(
+                (self.n1, self.n2, self.n3), self.unit_cell.lattice_vectors()
             )
             / 2
         )
@@ -120,6 +136,45 @@ class UnitCellPlotController(QObject):
             self.uc_plot_view.view.addItem(unit_cell_edges)
             self.uc_plot_items["unit_cell_edges"] = unit_cell_edges
 
+    def update_site_highlight(self) -> bool:
+        """
+        Highlight the selected `Site` without redrawing the plot.
+
+        Only the spheres of the previously and the newly selected sites
+        get new meshes. The rest of the scene is left untouched.
+
+        Returns
+        -------
+        bool
+            False if the plot is out of date (e.g., a `Site` was added or
+            removed since the last draw) and needs a full redraw.
+        """
+        if (
+            self.unit_cell is None
+            or self.unit_cell.id != self.selection.unit_cell
+            or self.plotted_sites != self.unit_cell.sites.keys()
+        ):
+            return False
+
+        new_site = self.selection.site
+        changed = {self.highlighted_site, new_site} - {None}
+        self.highlighted_site = new_site
+
+        for item in self.uc_plot_items.values():
+            site_id = getattr(item, "site_id", None)
+            if site_id not in changed:
+                continue
+            R = self.unit_cell.sites[site_id].R
+            sphere_radius = (
+                R * DEFAULT_SITE_SCALING if site_id == new_site else R
+            )
+            item.setMeshData(
+                meshdata=gl.MeshData.sphere(
+                    rows=10, cols=10, radius=sphere_radius
+                )
+            )
+        return True
+
     def _plot_sites(self, a1, a2, a3):
         """
         Plot all `Site`s within the `UnitCell` at (a1,a2,a3).
@@ -140,9 +195,10 @@ class UnitCellPlotController(QObject):
             return
 
         # Extract basis vectors
-        v1 = self.unit_cell.v1.as_array()
-        v2 = self.unit_cell.v2.as_array()
-        v3 = self.unit_cell.v3.as_array()
+        v1, v2, v3 = self.unit_cell.lattice_vectors()
+        # Shift the objects so that the illustration is centered
+        # at the origin
+        center_shift = -(self.n1 * v1 + self.n2 * v2 + self.n3 * v3) / 2
 
         # Plot each site as a sphere
         for site_id, site in self.unit_cell.sites.items():
@@ -150,12 +206,12 @@ class UnitCellPlotController(QObject):
             pos = (
                 (a1 + site.c1) * v1 + (a2 + site.c2) * v2 + (a3 + site.c3) * v3
             )
-            sphere_color = self.unit_cell.sites[site_id].color
+            sphere_color = site.color
 
             sphere_radius = (
-                self.unit_cell.sites[site_id].R * DEFAULT_SITE_SCALING
+                site.R * DEFAULT_SITE_SCALING
                 if site_id == self.selection.site
-                else self.unit_cell.sites[site_id].R
+                else site.R
             )
             # Create a sphere for the site.
             sphere = gl.GLMeshItem(
@@ -172,9 +228,7 @@ class UnitCellPlotController(QObject):
                 shader="shaded",
                 glOptions="translucent",
             )
-            # Shift the objects so that the illustration is centered
-            # at the origin
-            shift = -(self.n1 * v1 + self.n2 * v2 + self.n3 * v3) / 2 + pos
+            shift = center_shift + pos
             sphere.translate(shift[0], shift[1], shift[2])
 
             # Store site ID as user data for interaction
@@ -205,9 +259,7 @@ class UnitCellPlotController(QObject):
             return
 
         # Extract basis vectors
-        v1 = self.unit_cell.v1.as_array()
-        v2 = self.unit_cell.v2.as_array()
-        v3 = self.unit_cell.v3.as_array()
+        v1, v2, v3 = self.unit_cell.lattice_vectors()
 
         # Define the 8 corners of the parallelepiped
         verts = np.array(
@@ -261,9 +313,8 @@ class UnitCellPlotController(QObject):
 
         Parameters
         ----------
-        pair_selection : tuple
-            A tuple of (site_name, site_id, state_name, state_id)
-            representing the selected pair of states.
+        pair_selection : list[StateRef]
+            References to the selected pair of states.
             The first element is the source state and the second
             element is the target state.
         """
@@ -274,23 +325,20 @@ class UnitCellPlotController(QObject):
             self.uc_plot_view.view.removeItem(hopping_segments)
             del self.uc_plot_items["hopping_segments"]
 
-        # s1 and s2 are tuples (site_name, site_id, state_name, state_id)
         s1, s2 = pair_selection
-        hoppings = self.unit_cell.hoppings.get((s1[3], s2[3]))
+        hoppings = self.unit_cell.hoppings.get((s1.state_id, s2.state_id))
         # Early exit if the states are not coupled
         if hoppings is None:
             return
         # Get the basis vectors
-        v1 = self.unit_cell.v1.as_array()
-        v2 = self.unit_cell.v2.as_array()
-        v3 = self.unit_cell.v3.as_array()
+        v1, v2, v3 = self.unit_cell.lattice_vectors()
 
         # Get the location of the source site in the (0,0,0) unit cell
-        source = self.unit_cell.sites[s2[1]]
+        source = self.unit_cell.sites[s2.site_id]
         source_pos = source.c1 * v1 + source.c2 * v2 + source.c3 * v3
 
         # Get the location of the target sites in the (0,0,0) unit cell
-        target = self.unit_cell.sites[s1[1]]
+        target = self.unit_cell.sites[s1.site_id]
         target_pos = target.c1 * v1 + target.c2 * v2 + target.c3 * v3
 
         segments = []
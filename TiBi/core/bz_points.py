@@ -21,8 +21,8 @@ def interpolate_k_path(points: list[NDArray[np.float64]], n_total: int):
 
     Returns
     -------
-    NDArray[NDArray[np.float64]]
-        Array of interpolated k-points along the path
+    NDArray[np.float64]
+        Array of interpolated k-points along the path, one point per row
     """
     points = np.array(points)
     # Get the distances between consecutive points
@@ -31,21 +31,24 @@ def interpolate_k_path(points: list[NDArray[np.float64]], n_total: int):
     total_distance = np.sum(distances)
 
     # Allocate number of points per segment
-    n_segments = len(points) - 1
     fractions = distances / total_distance
-    n_points_segment = [max(2, int(round(f * n_total))) for f in fractions]
-
-    # Build the full path
-    k_path = []
-    for ii in range(n_segments):
-        start = points[ii]
-        end = points[ii + 1]
-        n_pts = n_points_segment[ii]
-        segment = np.linspace(start, end, n_pts, endpoint=False)
-        k_path.extend(segment)
-
+    n_points_segment = np.maximum(2, np.round(fractions * n_total).astype(int))
+
+    # Build the full path without assembling it segment by segment. Each
+    # point is the start of its segment shifted by an integer number of
+    # steps, with the end point of a segment being the start of the next.
+    n_points_path = np.sum(n_points_segment)
+    steps = np.diff(points, axis=0) / n_points_segment[:, None]
+    step_idx = np.arange(n_points_path) - np.repeat(
+        np.cumsum(n_points_segment) - n_points_segment, n_points_segment
+    )
+    k_path = np.empty((n_points_path + 1, points.shape[1]))
+    k_path[:-1] = np.repeat(points[:-1], n_points_segment, axis=0)
+    k_path[:-1] += step_idx[:, None] * np.repeat(
+        steps, n_points_segment, axis=0
+    )
     # Add the final high-symmetry point
-    k_path.append(points[-1])
+    k_path[-1] = points[-1]
 
     return k_path
 
@@ -1,14 +1,56 @@
-import copy
 import numpy as np
 from numpy.typing import NDArray
 from PySide6.QtCore import Signal
 from PySide6.QtGui import QUndoCommand
+from typing import TYPE_CHECKING
 
 from TiBi.models import UnitCell
-from TiBi.views.computation_view import ComputationView
 
+if TYPE_CHECKING:
+    from TiBi.views.computation_view import ComputationView
 
-class AddBZPointCommand(QUndoCommand):
+
+class _BZPathCommand(QUndoCommand):
+    """
+    Base class for the commands editing the Brillouin zone path.
+
+    Attributes
+    ----------
+    unit_cell : UnitCell
+        `UnitCell` whose path is edited
+    computation_view : ComputationView
+        UI object containing the computation view
+    signal : Signal
+        Signal to be emitted to trigger a redraw of the BZ path
+    """
+
+    def __init__(
+        self,
+        text: str,
+        unit_cell: UnitCell,
+        computation_view: "ComputationView",
+        signal: Signal,
+    ):
+        super().__init__(text)
+        self.unit_cell = unit_cell
+        self.computation_view = computation_view
+        self.signal = signal
+
+    def _update_path_buttons(self):
+        """
+        Enable the path editing and computation buttons.
+
+        The path can be edited if it has at least one point and the bands
+        can be computed if it has at least two.
+        """
+        n_points = len(self.unit_cell.bandstructure.special_points)
+        bands_panel = self.computation_view.bands_panel
+        bands_panel.remove_last_btn.setEnabled(n_points > 0)
+        bands_panel.clear_path_btn.setEnabled(n_points > 0)
+        bands_panel.compute_bands_btn.setEnabled(n_points > 1)
+
+
+class AddBZPointCommand(_BZPathCommand):
     """
     Add a point to the special points path in the Brillouin zone.
 
@@ -31,45 +73,26 @@ class AddBZPointCommand(QUndoCommand):
         self,
         unit_cell: UnitCell,
         point: NDArray[np.float64],
-        computation_view: ComputationView,
+        computation_view: "ComputationView",
         signal: Signal,
     ):
-        super().__init__("Add BZ Path Point")
-        self.unit_cell = unit_cell
+        super().__init__(
+            "Add BZ Path Point", unit_cell, computation_view, signal
+        )
         self.point = point
-        self.computation_view = computation_view
-        self.signal = signal
 
     def redo(self):
-
         self.unit_cell.bandstructure.add_point(self.point)
-        self.computation_view.bands_panel.remove_last_btn.setEnabled(
-            len(self.unit_cell.bandstructure.special_points) > 0
-        )
-        self.computation_view.bands_panel.clear_path_btn.setEnabled(
-            len(self.unit_cell.bandstructure.special_points) > 0
-        )
-        self.computation_view.bands_panel.compute_bands_btn.setEnabled(
-            len(self.unit_cell.bandstructure.special_points) > 1
-        )
+        self._update_path_buttons()
         self.signal.emit()
 
     def undo(self):
-
         self.unit_cell.bandstructure.remove_point()
-        self.computation_view.bands_panel.remove_last_btn.setEnabled(
-            len(self.unit_cell.bandstructure.special_points) > 0
-        )
-        self.computation_view.bands_panel.clear_path_btn.setEnabled(
-            len(self.unit_cell.bandstructure.special_points) > 0
-        )
-        self.computation_view.bands_panel.compute_bands_btn.setEnabled(
-            len(self.unit_cell.bandstructure.special_points) > 1
-        )
+        self._update_path_buttons()
         self.signal.emit()
 
 
-class RemoveBZPointCommand(QUndoCommand):
+class RemoveBZPointCommand(_BZPathCommand):
     """
     Remove the last point from the special points path in the Brillouin zone.
 
@@ -91,46 +114,29 @@ class RemoveBZPointCommand(QUndoCommand):
     def __init__(
         self,
         unit_cell: UnitCell,
-        computation_view: ComputationView,
+        computation_view: "ComputationView",
         signal: Signal,
     ):
-        super().__init__("Remove BZ Path Point")
-        self.unit_cell = unit_cell
-        self.computation_view = computation_view
-        self.signal = signal
-
-        self.point = copy.deepcopy(
-            self.unit_cell.bandstructure.special_points[-1]
+        super().__init__(
+            "Remove BZ Path Point", unit_cell, computation_view, signal
         )
 
+        # The points are never modified in place, so the removed point
+        # can be kept by reference
+        self.point = self.unit_cell.bandstructure.special_points[-1]
+
     def redo(self):
         self.unit_cell.bandstructure.remove_point()
-        self.computation_view.bands_panel.remove_last_btn.setEnabled(
-            len(self.unit_cell.bandstructure.special_points) > 0
-        )
-        self.computation_view.bands_panel.clear_path_btn.setEnabled(
-            len(self.unit_cell.bandstructure.special_points) > 0
-        )
-        self.computation_view.bands_panel.compute_bands_btn.setEnabled(
-            len(self.unit_cell.bandstructure.special_points) > 1
-        )
+        self._update_path_buttons()
         self.signal.emit()
 
     def undo(self):
         self.unit_cell.bandstructure.add_point(self.point)
-        self.computation_view.bands_panel.remove_last_btn.setEnabled(
-            len(self.unit_cell.bandstructure.special_points) > 0
-        )
-        self.computation_view.bands_panel.clear_path_btn.setEnabled(
-            len(self.unit_cell.bandstructure.special_points) > 0
-        )
-        self.computation_view.bands_panel.compute_bands_btn.setEnabled(
-            len(self.unit_cell.bandstructure.special_points) > 1
-        )
+        self._update_path_buttons()
         self.signal.emit()
 
 
-class ClearBZPathCommand(QUndoCommand):
+class ClearBZPathCommand(_BZPathCommand):
     """
     Clear the special points path in the Brillouin zone.
 
@@ -152,43 +158,22 @@ class ClearBZPathCommand(QUndoCommand):
     def __init__(
         self,
         unit_cell: UnitCell,
-        computation_view: ComputationView,
+        computation_view: "ComputationView",
         signal: Signal,
     ):
-        super().__init__("Add BZ Path Point")
-        self.unit_cell = unit_cell
-        self.computation_view = computation_view
-        self.signal = signal
+        super().__init__("Clear BZ Path", unit_cell, computation_view, signal)
 
-        self.special_points = copy.deepcopy(
-            self.unit_cell.bandstructure.special_points
-        )
+        # The points are never modified in place, so a shallow copy of the
+        # list is enough to restore the path
+        self.special_points = list(self.unit_cell.bandstructure.special_points)
 
     def redo(self):
         self.unit_cell.bandstructure.clear()
-        self.computation_view.bands_panel.remove_last_btn.setEnabled(
-            len(self.unit_cell.bandstructure.special_points) > 0
-        )
-        self.computation_view.bands_panel.clear_path_btn.setEnabled(
-            len(self.unit_cell.bandstructure.special_points) > 0
-        )
-        self.computation_view.bands_panel.compute_bands_btn.setEnabled(
-            len(self.unit_cell.bandstructure.special_points) > 1
-        )
+        self._update_path_buttons()
         self.signal.emit()
 
     def undo(self):
         self.unit_cell.bandstructure.clear()
-        self.unit_cell.bandstructure.special_points = copy.deepcopy(
-            self.special_points
-        )
-        self.computation_view.bands_panel.remove_last_btn.setEnabled(
-            len(self.unit_cell.bandstructure.special_points) > 0
-        )
-        self.computation_view.bands_panel.clear_path_btn.setEnabled(
-            len(self.unit_cell.bandstructure.special_points) > 0
-        )
-        self.computation_view.bands_panel.compute_bands_btn.setEnabled(
-            len(self.unit_cell.bandstructure.special_points) > 1
-        )
+        self.unit_cell.bandstructure.special_points = list(self.special_points)
+        self._update_path_buttons()
         self.signal.emit()
@@ -1,11 +1,10 @@
-import copy
 import numpy as np
 from PySide6.QtCore import Signal
 from PySide6.QtGui import QUndoCommand
 from typing import Tuple
 import uuid
 
-from TiBi.models import Selection, UnitCell
+from TiBi.models import Selection, StateRef, UnitCell
 
 
 class SaveHoppingsCommand(QUndoCommand):
@@ -28,12 +27,10 @@ class SaveHoppingsCommand(QUndoCommand):
         UUID of the selected `Site` when the command was issued
     state_id : uuid.UUID
         UUID of the selected `State` when the command was issued
-    pair_selection : list[Tuple[str, uuid.UUID, str, uuid.UUID]]
+    pair_selection : list[StateRef]
         Reference to the list of selected `State`s
-    s1, s2 : Tuple[str, uuid.UUID, str, uuid.UUID]
-        Information tuples for the selected `State`s, containing
-        (site name, site UUID, state name, state UUID) when the
-        command was issued
+    s1, s2 : StateRef
+        References to the selected `State`s when the command was issued
     new_hoppings : list[Tuple[Tuple[int, int, int], np.complex128]]
         List of new hoppings to be added to the `hoppings` dictionary
     old_hoppings : list[Tuple[Tuple[int, int, int], np.complex128]]
@@ -48,7 +45,7 @@ class SaveHoppingsCommand(QUndoCommand):
         self,
         unit_cells: dict[uuid.UUID, UnitCell],
         selection: Selection,
-        pair_selection: list[Tuple[str, uuid.UUID, str, uuid.UUID]],
+        pair_selection: list[StateRef],
         new_hoppings: list[Tuple[Tuple[int, int, int], np.complex128]],
         signal: Signal,
     ):
@@ -65,23 +62,23 @@ class SaveHoppingsCommand(QUndoCommand):
         self.s2 = pair_selection[1]
 
         self.new_hoppings = new_hoppings
-        self.old_hoppings = copy.deepcopy(
+        # The hopping entries are immutable tuples, so only the list
+        # itself needs to be copied
+        self.old_hoppings = list(
             self.unit_cells[self.uc_id].hoppings.get(
-                (self.s1[3], self.s2[3]), []
+                (self.s1.state_id, self.s2.state_id), []
             )
         )
         self.signal = signal
 
     def redo(self):
         # Insert the hoppings into the unit cell model
-        if self.new_hoppings == []:
-            self.unit_cells[self.uc_id].hoppings.pop(
-                (self.s1[3], self.s2[3]), None
-            )
+        hoppings = self.unit_cells[self.uc_id].hoppings
+        key = (self.s1.state_id, self.s2.state_id)
+        if self.new_hoppings:
+            hoppings[key] = self.new_hoppings
         else:
-            self.unit_cells[self.uc_id].hoppings[
-                (self.s1[3], self.s2[3])
-            ] = self.new_hoppings
+            hoppings.pop(key, None)
         self.unit_cells[self.uc_id].bandstructure.reset_bands()
         self.unit_cells[self.uc_id].bz_grid.clear()
         # Emit the signal with appropriate selection parameters
@@ -91,14 +88,12 @@ class SaveHoppingsCommand(QUndoCommand):
 
     def undo(self):
         # Insert the hoppings into the unit cell model
-        if self.old_hoppings == []:
-            self.unit_cells[self.uc_id].hoppings.pop(
-                (self.s1[3], self.s2[3]), None
-            )
+        hoppings = self.unit_cells[self.uc_id].hoppings
+        key = (self.s1.state_id, self.s2.state_id)
+        if self.old_hoppings:
+            hoppings[key] = self.old_hoppings
         else:
-            self.unit_cells[self.uc_id].hoppings[
-                (self.s1[3], self.s2[3])
-            ] = self.old_hoppings
+            hoppings.pop(key, None)
         self.unit_cells[self.uc_id].bandstructure.reset_bands()
         self.unit_cells[self.uc_id].bz_grid.clear()
         # Emit the signal with appropriate selection parameters
@@ -1,6 +1,6 @@
-import copy
-from PySide6.QtCore import QItemSelectionModel, Signal
+from PySide6.QtCore import Signal
 from PySide6.QtGui import QStandardItem, QUndoCommand
+from typing import TYPE_CHECKING
 import uuid
 
 from TiBi.models import Selection, UnitCell
@@ -9,7 +9,9 @@ from TiBi.models.factories import (
     mk_new_site,
     mk_new_state,
 )
-from TiBi.views.widgets import SystemTree
+
+if TYPE_CHECKING:
+    from TiBi.views.widgets import SystemTree
 
 
 class AddUnitCellCommand(QUndoCommand):
@@ -37,7 +39,7 @@ class AddUnitCellCommand(QUndoCommand):
     """
 
     def __init__(
-        self, unit_cells: dict[uuid.UUID, UnitCell], tree_view: SystemTree
+        self, unit_cells: dict[uuid.UUID, UnitCell], tree_view: "SystemTree"
     ):
         super().__init__("Add Unit Cell")
         self.unit_cells = unit_cells
@@ -87,7 +89,7 @@ class AddSiteCommand(QUndoCommand):
         self,
         unit_cells: dict[uuid.UUID, UnitCell],
         selection: Selection,
-        tree_view: SystemTree,
+        tree_view: "SystemTree",
     ):
         super().__init__("Add Site")
         self.unit_cells = unit_cells
@@ -142,7 +144,7 @@ class AddStateCommand(QUndoCommand):
         self,
         unit_cells: dict[uuid.UUID, UnitCell],
         selection: Selection,
-        tree_view: SystemTree,
+        tree_view: "SystemTree",
         signal: Signal,
     ):
         super().__init__("Add State")
@@ -211,13 +213,16 @@ class DeleteItemCommand(QUndoCommand):
         UUID of the selected `Site` when the command was issued
     state_id : uuid.UUID
         UUID of the selected `State` when the command was issued
+    item : UnitCell | Site | State
+        The deleted object, moved out of the model by `redo` and put back
+        by `undo`
     """
 
     def __init__(
         self,
         unit_cells: dict[uuid.UUID, UnitCell],
         selection: Selection,
-        tree_view: SystemTree,
+        tree_view: "SystemTree",
         signal: Signal,
     ):
         super().__init__("Delete Item")
@@ -230,72 +235,39 @@ class DeleteItemCommand(QUndoCommand):
         self.site_id = self.selection.site
         self.state_id = self.selection.state
 
-        # Save the item to be deleted for undo
-        if self.state_id:
-            self.item = copy.deepcopy(
-                self.unit_cells[self.uc_id]
-                .sites[self.site_id]
-                .states[self.state_id]
-            )
-        # No state selected, therefore remove the site from the unit cell
-        elif self.site_id:
-            self.item = copy.deepcopy(
-                self.unit_cells[self.uc_id].sites[self.site_id]
-            )
-
-        # No site selected, therefore remove the unit cell from the model
-        elif self.uc_id:
-            self.item = copy.deepcopy(self.unit_cells[self.uc_id])
-
     # Delete the item
     def redo(self):
         if self.state_id:
-            # Get the hoppings involving the states, remove them
+            # Get the hoppings involving the state, remove them
             # from the hopping dictionary and store them to be used
             # in the undo method
-            self.removed_hoppings = {}
-            kept_hoppings = {}
-            for k, v in self.unit_cells[self.uc_id].hoppings.items():
-                if self.state_id in k:
-                    self.removed_hoppings[k] = v
-                else:
-                    kept_hoppings[k] = v
-            self.unit_cells[self.uc_id].hoppings = kept_hoppings
+            self.removed_hoppings = self._pop_hoppings({self.state_id})
             self.unit_cells[self.uc_id].bandstructure.reset_bands()
             self.unit_cells[self.uc_id].bz_grid.clear()
-            # Delete the selected state from the site
-            del (
+            # Move the selected state out of the site. Nothing else refers
+            # to it once it leaves the model, so it is kept for undo as is.
+            self.item = (
                 self.unit_cells[self.uc_id]
                 .sites[self.site_id]
-                .states[self.state_id]
+                .states.pop(self.state_id)
             )
             self.signal.emit()
 
         # No state selected, therefore remove the site from the unit cell
         elif self.site_id:
-            self.removed_hoppings = {}
-            kept_hoppings = {}
-            for state in (
-                self.unit_cells[self.uc_id].sites[self.site_id].states.values()
-            ):
-                for k, v in self.unit_cells[self.uc_id].hoppings.items():
-                    if state.id in k:
-                        self.removed_hoppings[k] = v
-                    else:
-                        kept_hoppings[k] = v
-            self.unit_cells[self.uc_id].hoppings = kept_hoppings
+            self.removed_hoppings = self._pop_hoppings(
+                self.unit_cells[self.uc_id].sites[self.site_id].states.keys()
+            )
             if self.removed_hoppings:
                 self.unit_cells[self.uc_id].bandstructure.reset_bands()
                 self.unit_cells[self.uc_id].bz_grid.clear()
+            self.item = self.unit_cells[self.uc_id].sites.pop(self.site_id)
             # If the site has states, request a redraw of the hopping matrix
-            if self.unit_cells[self.uc_id].sites[self.site_id].states:
-                del self.unit_cells[self.uc_id].sites[self.site_id]
+            if self.item.states:
                 self.signal.emit()
-            else:
-                del self.unit_cells[self.uc_id].sites[self.site_id]
         # No site selected, therefore remove the unit cell from the model
         elif self.uc_id:
-            del self.unit_cells[self.uc_id]
+            self.item = self.unit_cells.pop(self.uc_id)
 
         self.tree_view.remove_tree_item(
             self.uc_id, self.site_id, self.state_id
@@ -325,14 +297,33 @@ class DeleteItemCommand(QUndoCommand):
         elif self.uc_id:
             self.unit_cells[self.item.id] = self.item
 
-        # Refresh the tree and select the item
-        self.tree_view.refresh_tree(self.unit_cells)
-        index = self.tree_view.find_item_by_id(
-            uc_id=self.uc_id, site_id=self.site_id, state_id=self.state_id
-        ).index()
-        self.tree_view.selectionModel().setCurrentIndex(
-            index, QItemSelectionModel.ClearAndSelect
-        )
+        # Put the item back into the tree and select it
+        self.tree_view.restore_tree_item(self.item, self.uc_id, self.site_id)
+
+    def _pop_hoppings(self, state_ids) -> dict:
+        """
+        Remove the hoppings involving any of the given states.
+
+        The hopping dictionary is traversed once and the matching entries
+        are popped in place.
+
+        Parameters
+        ----------
+        state_ids : Iterable[uuid.UUID]
+            UUIDs of the `State`s whose hoppings are removed
+
+        Returns
+        -------
+        dict[tuple[uuid.UUID, uuid.UUID], list]
+            The removed hoppings, to be restored on undo
+        """
+        hoppings = self.unit_cells[self.uc_id].hoppings
+        state_ids = frozenset(state_ids)
+        return {
+            k: hoppings.pop(k)
+            for k in list(hoppings)
+            if not state_ids.isdisjoint(k)
+        }
 
 
 class RenameTreeItemCommand(QUndoCommand):
@@ -369,7 +360,7 @@ class RenameTreeItemCommand(QUndoCommand):
         self,
         unit_cells: dict[uuid.UUID, UnitCell],
         selection: Selection,
-        tree_view: SystemTree,
+        tree_view: "SystemTree",
         signal: Signal,
         item: QStandardItem,
     ):
@@ -1,10 +1,13 @@
 from PySide6.QtCore import Signal
 from PySide6.QtGui import QColor, QUndoCommand
 from PySide6.QtWidgets import QApplication, QDoubleSpinBox, QRadioButton
+from typing import TYPE_CHECKING
 import uuid
 
 from TiBi.models import BasisVector, Selection, UnitCell
-from TiBi.views.uc_view import UnitCellView
+
+if TYPE_CHECKING:
+    from TiBi.views.uc_view import UnitCellView
 
 
 class UpdateUnitCellParameterCommand(QUndoCommand):
@@ -121,7 +124,7 @@ class ReduceBasisCommand(QUndoCommand):
         self,
         unit_cells: dict[uuid.UUID, UnitCell],
         selection: Selection,
-        unit_cell_view: UnitCellView,
+        unit_cell_view: "UnitCellView",
         signal: Signal,
     ):
         super().__init__("Reduce Basis")
@@ -234,7 +237,7 @@ class ChangeDimensionalityCommand(QUndoCommand):
         self,
         unit_cells: dict[uuid.UUID, UnitCell],
         selection: Selection,
-        unit_cell_view: UnitCellView,
+        unit_cell_view: "UnitCellView",
         signal: Signal,
         dim: int,
         buttons: list[QRadioButton],
@@ -461,7 +464,7 @@ class ChangeSiteColorCommand(QUndoCommand):
         selection: Selection,
         new_color: QColor,
         old_color: QColor,
-        unit_cell_view: UnitCellView,
+        unit_cell_view: "UnitCellView",
         signal: Signal,
     ):
         super().__init__("Change Site Color")
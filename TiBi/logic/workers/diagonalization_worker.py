@@ -26,25 +26,28 @@ class DiagonalizationWorker(Worker):
         At the end of the computation, emit a signal with the results.
         """
 
-        emit_interval = max(len(self.k_points) // 100, 1)
+        n_points = len(self.k_points)
+        # The k-points are diagonalized in batches, with the Hamiltonians of
+        # a batch built and passed to LAPACK at once. The batch size matches
+        # the progress reporting granularity, so that the task can still be
+        # aborted and its progress displayed.
+        batch_size = max(n_points // 100, 1)
 
         eigenvalues = []
         eigenvectors = []
         self.progress_updated.emit(0)
 
-        for ii, k in enumerate(self.k_points):
+        for start in range(0, n_points, batch_size):
             if self._abort:
                 self.task_aborted.emit()
                 return
 
-            H = self.hamiltonian_func(k)
+            end = min(start + batch_size, n_points)
+            H = self.hamiltonian_func(np.array(self.k_points[start:end]))
             solution = np.linalg.eigh(H)
-            eigenvalues.append(solution[0])
-            eigenvectors.append(solution[1])
+            eigenvalues.extend(solution[0])
+            eigenvectors.extend(solution[1])
 
-            if ii % emit_interval == 0 or ii == len(self.k_points) - 1:
-                self.progress_updated.emit(
-                    int((ii + 1) / len(self.k_points) * 100)
-                )
+            self.progress_updated.emit(int(end / n_points * 100))
 
         self.task_finished.emit((eigenvalues, eigenvectors, self.k_points))
@@ -4,6 +4,7 @@ from .bz_grid import BrillouinZoneGrid
 from .selection import Selection
 from .site import Site
 from .state import State
+from .state_ref import StateRef
 from .unit_cell import UnitCell
 
 __all__ = [
@@ -13,5 +14,6 @@ __all__ = [
     "Selection",
     "Site",
     "State",
+    "StateRef",
     "UnitCell",
 ]  # noqa: F401
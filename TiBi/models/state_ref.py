@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+import uuid
+
+
+@dataclass(frozen=True, slots=True)
+class StateRef:
+    """
+    A reference to a `State` together with the `Site` hosting it.
+
+    `StateRef`s are produced by `UnitCell.get_states` and identify the rows
+    and columns of the hopping matrix. They are immutable, so they can be
+    shared between the controllers and the undo commands.
+
+    Attributes
+    ----------
+    site_name : str
+        Name of the `Site` hosting the `State`
+    site_id : uuid.UUID
+        Unique identifier of the `Site`
+    state_name : str
+        Name of the `State`
+    state_id : uuid.UUID
+        Unique identifier of the `State`
+    """
+
+    site_name: str
+    site_id: uuid.UUID
+    state_name: str
+    state_id: uuid.UUID
@@ -2,15 +2,13 @@ from dataclasses import dataclass, field
 import itertools
 import numpy as np
 from numpy.typing import NDArray
-from sympy.polys.domains import ZZ
-from sympy.polys.matrices import DM
-from scipy.spatial import Voronoi
 import uuid
 
 from .band_structure import BandStructure
 from .basis_vector import BasisVector
 from .bz_grid import BrillouinZoneGrid
 from .site import Site
+from .state_ref import StateRef
 
 
 @dataclass
@@ -50,6 +48,8 @@ class UnitCell:
 
     Methods
     -------
+    lattice_vectors(periodic_only=False)
+        Return the basis vectors as the rows of a 3x3 NumPy array.
     volume()
         Compute the volume of the `UnitCell` using the scalar triple
         product.
@@ -82,6 +82,35 @@ class UnitCell:
     bandstructure: BandStructure = field(default_factory=BandStructure)
     bz_grid: BrillouinZoneGrid = field(default_factory=BrillouinZoneGrid)
     id: uuid.UUID = field(default_factory=uuid.uuid4)
+    # Last computed Brillouin zone together with the lattice it belongs to
+    _bz_cache: tuple | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def lattice_vectors(
+        self, periodic_only: bool = False
+    ) -> NDArray[np.float64]:
+        """
+        Return the basis vectors as the rows of a 3x3 NumPy array.
+
+        Parameters
+        ----------
+        periodic_only : bool, optional
+            If `True`, the rows of the non-periodic vectors are set to zero.
+
+        Returns
+        -------
+        NDArray[np.float64]
+            Array whose rows are the Cartesian components of v1, v2, and v3
+        """
+        vectors = np.array(
+            [[v.x, v.y, v.z] for v in (self.v1, self.v2, self.v3)],
+            dtype=np.float64,
+        )
+        if periodic_only:
+            periodic = [v.is_periodic for v in (self.v1, self.v2, self.v3)]
+            vectors[np.logical_not(periodic)] = 0.0
+        return vectors
 
     def volume(self) -> np.float64:
         """
@@ -92,7 +121,7 @@ class UnitCell:
         np.float64
             Volume of the unit cell in arbitrary units
         """
-        a1, a2, a3 = [v.as_array() for v in [self.v1, self.v2, self.v3]]
+        a1, a2, a3 = self.lattice_vectors()
         return np.abs(np.dot(a1, np.cross(a2, a3)))
 
     def is_hermitian(self) -> bool:
@@ -220,6 +249,11 @@ class UnitCell:
         if len(periodic_vectors) < 2:
             return vs  # Return unchanged
 
+        # sympy is only needed for the reduction itself and is slow to import,
+        # so it is loaded on first use rather than at application start
+        from sympy.polys.domains import ZZ
+        from sympy.polys.matrices import DM
+
         # Reduced vectors
         reduced = DM(periodic_vectors, ZZ).lll().to_list()
         # Rebuild full list with reduced periodic vectors in original order
@@ -250,17 +284,19 @@ class UnitCell:
 
         Returns
         -------
-        tuple[list[State], list[tuple[str, uuid.UUID, str, uuid.UUID]]]
+        tuple[list[State], list[StateRef]]
             A tuple containing a list of `State` objects and a list of
-            tuples (site_name, site_id, state_name, state_id)
-            providing context for each state (which site it belongs to).
+            `StateRef`s providing context for each state (which site it
+            belongs to).
         """
         states = []
         state_info = []
         for site_id, site in self.sites.items():
             for state_id, state in site.states.items():
                 states.append(state)
-                state_info.append((site.name, site_id, state.name, state_id))
+                state_info.append(
+                    StateRef(site.name, site_id, state.name, state_id)
+                )
         return (states, state_info)
 
     def get_BZ(self):
@@ -276,6 +312,10 @@ class UnitCell:
         For 2D, bz_faces contains the edges of the 2D BZ polygon.
         For 3D, bz_faces contains the polygonal faces of the 3D BZ polyhedron.
 
+        The result depends only on the basis vectors, so it is cached and
+        reused until one of them changes. The returned arrays are shared
+        between calls and should not be modified.
+
         Returns
         -------
         tuple[NDArray[NDArray[np.float64]],\
@@ -284,6 +324,12 @@ class UnitCell:
             The second element gives a list of faces, where each face is
             defined by vertex points. In 2D, the "faces" are edges.
         """
+        lattice = tuple(
+            (v.x, v.y, v.z, v.is_periodic) for v in [self.v1, self.v2, self.v3]
+        )
+        if self._bz_cache is not None and self._bz_cache[0] == lattice:
+            return self._bz_cache[1]
+
         n_neighbors = (
             1  # Number of neighboring reciprocal lattice points to consider
         )
@@ -323,6 +369,9 @@ class UnitCell:
                 ]
                 all_points = np.vstack([np.zeros(3), points])
 
+            # Imported here to keep scipy off the startup import path
+            from scipy.spatial import Voronoi
+
             vor = Voronoi(all_points)
 
             # Start by getting the vertices of the Brillouin zone
@@ -357,6 +406,8 @@ class UnitCell:
                     face = vor.vertices[ridge_vertices]
                     bz_faces.append(face)
             bz_faces = np.array(bz_faces)
+
+        self._bz_cache = (lattice, (bz_vertices, bz_faces))
         return bz_vertices, bz_faces
 
     def get_hamiltonian_function(self):
@@ -388,15 +439,35 @@ class UnitCell:
         # state_id identifies the state, idx is its index in the Hamiltonian
         # matrix (to keep track of rows/columns)
         state_to_idx = {
-            state_id: idx for idx, (_, _, _, state_id) in enumerate(state_info)
+            info.state_id: idx for idx, info in enumerate(state_info)
         }
 
         # Store the total number of states for matrix size
         n_states = len(states)
         # Basis vectors as arrays
-        v1 = self.v1.as_array() if self.v1.is_periodic else np.zeros(3)
-        v2 = self.v2.as_array() if self.v2.is_periodic else np.zeros(3)
-        v3 = self.v3.as_array() if self.v3.is_periodic else np.zeros(3)
+        basis = self.lattice_vectors(periodic_only=True)
+
+        # Flatten the hoppings into arrays of amplitudes and real-space
+        # displacement vectors, so that the phase factors for all hoppings
+        # and k-points can be evaluated in a single operation. The hoppings
+        # of each pair of states are stored contiguously, starting at the
+        # corresponding entry of pair_starts.
+        pair_idx, pair_starts, amplitudes, displacements = [], [], [], []
+        for (dest_id, source_id), hoppings in self.hoppings.items():
+            if not hoppings:
+                continue
+            # Position of the matrix element in the flattened Hamiltonian
+            pair_idx.append(
+                state_to_idx[dest_id] * n_states + state_to_idx[source_id]
+            )
+            pair_starts.append(len(amplitudes))
+            for displacement, amplitude in hoppings:
+                amplitudes.append(amplitude)
+                displacements.append(displacement)
+        amplitudes = np.array(amplitudes, dtype=np.complex128)
+        # Real-space displacement vectors d1 * v1 + d2 * v2 + d3 * v3,
+        # restricted to the periodic directions
+        R = (np.reshape(displacements, (-1, 3)) @ basis)[:, 0:num_periodic]
 
         # Define the Hamiltonian function that will be returned
         def hamiltonian(k):
@@ -408,49 +479,47 @@ class UnitCell:
             and its hopping parameters.
             The matrix elements include phase factors exp(-i k·R) for hoppings
             between different unit cells, as required by Bloch's theorem.
+            Several k-points can be passed at once as the rows of a 2D
+            array, in which case the Hamiltonians are stacked along the
+            first axis.
 
             Parameters
             ----------
             k : NDArray[np.float64]
                 k-point vector in the basis of reciprocal lattice vectors
                 If the system has n periodic directions, k should be an
-                n-dimensional vector
+                n-dimensional vector, or an (N, n) array of N vectors
 
             Returns
             -------
             NDArray[np.float64]
-                Complex Hamiltonian matrix of size (n_states, n_states)
+                Complex Hamiltonian matrix of size (n_states, n_states),
+                or an array of N such matrices
             """
+            k = np.asarray(k)
+            batched = k.ndim == 2
+            k_points = k if batched else k[np.newaxis]
+
             # Validate the k-point dimension matches the number of
             # periodic directions
-            if len(k) != num_periodic:
+            if k_points.shape[1] != num_periodic:
                 raise ValueError("Momentum does not match system periodicity")
 
-            # Initialize the Hamiltonian matrix with zeros
-            H = np.zeros((n_states, n_states), dtype=np.complex128)
-
-            # Fill the Hamiltonian matrix
-            for (dest_id, source_id), hoppings in self.hoppings.items():
-                dest_idx = state_to_idx[dest_id]  # Destination state index
-                source_idx = state_to_idx[source_id]  # Source state index
-
-                for displacement, amplitude in hoppings:
-                    d1, d2, d3 = displacement
-
-                    # Calculate the real-space displacement vector
-                    # This is the sum of the periodic vectors scaled by
-                    # the displacement
-                    R = d1 * v1 + d2 * v2 + d3 * v3
-
-                    # Apply Bloch phase factor: exp(-i k·R)
-                    if num_periodic == 0:
-                        phase = 1.0
-                    else:
-                        phase = np.exp(1j * np.dot(k, R[0:num_periodic]))
-
-                    # Add the term to the Hamiltonian
-                    H[dest_idx, source_idx] += amplitude * phase
+            # Initialize the Hamiltonian matrices with zeros
+            H = np.zeros(
+                (len(k_points), n_states, n_states), dtype=np.complex128
+            )
 
-            return H
+            # Apply Bloch phase factors exp(-i k·R) to the amplitudes of
+            # all hoppings at every k-point
+            if pair_idx:
+                terms = amplitudes * np.exp(1j * (k_points @ R.T))
+                # Sum the terms of each pair of states and place them
+                # in the Hamiltonian
+                H.reshape(len(k_points), -1)[:, pair_idx] = np.add.reduceat(
+                    terms, pair_starts, axis=1
+                )
+
+            return H if batched else H[0]
 
         return hamiltonian
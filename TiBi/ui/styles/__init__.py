@@ -1,14 +1,8 @@
-from .button_styles import (
-    BUTTON_STYLE_DEFAULT,
-    BUTTON_STYLE_HAS_HOPPING,
-    BUTTON_STYLE_NONHERMITIAN,
-)
+from .button_styles import HOPPING_BUTTON_STYLE
 from .theme_settings import hex_to_rgb, THEME_SETTINGS
 
 __all__ = [
-    "BUTTON_STYLE_DEFAULT",
-    "BUTTON_STYLE_HAS_HOPPING",
-    "BUTTON_STYLE_NONHERMITIAN",
+    "HOPPING_BUTTON_STYLE",
     "hex_to_rgb",
     "THEME_SETTINGS",
 ]  # noqa: F401
@@ -1,33 +1,32 @@
-# Hopping button style constants
-BUTTON_STYLE_DEFAULT = """
-    QPushButton {
+# Hopping matrix button styles.
+# The style sheet is set once on the widget holding the matrix. Each button
+# picks its variant through the "hopping" dynamic property, which is one of
+# "none", "hermitian" or "nonhermitian".
+HOPPING_BUTTON_STYLE = """
+    QPushButton[hopping="none"] {
         background-color: #e0e0e0;
         border: 1px solid #aaaaaa;
         border-radius: 3px;
     }
-    QPushButton:hover {
+    QPushButton[hopping="none"]:hover {
         background-color: #d0d0d0;
         border: 1px solid #777777;
     }
-"""
-BUTTON_STYLE_HAS_HOPPING = """
-    QPushButton {
+    QPushButton[hopping="hermitian"] {
         background-color: #56b4e9;
         border: 1px solid #0072b2;
         border-radius: 3px;
     }
-    QPushButton:hover {
+    QPushButton[hopping="hermitian"]:hover {
         background-color: #50a7d9;
         border: 1px solid #015a8c;
     }
-"""
-BUTTON_STYLE_NONHERMITIAN = """
-    QPushButton {
+    QPushButton[hopping="nonhermitian"] {
         background-color: #cc79a7;
         border: 1px solid #d55c00;
         border-radius: 3px;
     }
-    QPushButton:hover {
+    QPushButton[hopping="nonhermitian"]:hover {
         background-color: #b86593;
         border: 1px solid #b34e02;
     }
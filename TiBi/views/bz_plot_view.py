@@ -1,5 +1,5 @@
 import numpy as np
-from PySide6.QtWidgets import QVBoxLayout, QWidget
+from PySide6.QtWidgets import QSizePolicy, QVBoxLayout, QWidget
 import pyqtgraph.opengl as gl
 from TiBi.ui import (
     CF_VERMILLION,
@@ -27,7 +27,9 @@ class BrillouinZonePlotView(QWidget):
 
     def __init__(self):
         super().__init__()
-        self.setMinimumHeight(150)
+        # Let the plot stretch with the window above a usable minimum
+        self.setMinimumSize(300, 150)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
         # Colors
         self.point_color = CF_BLUE
@@ -59,6 +59,3 @@ class ComputationView(QWidget):
         self.tabs.setDocumentMode(True)
 
         layout.addWidget(self.tabs)
-
-        # Set the layout for this widget
-        self.setLayout(layout)
@@ -1,6 +1,5 @@
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
-    QFrame,
     QHBoxLayout,
     QMainWindow,
     QSizePolicy,
@@ -51,6 +50,7 @@ class MainWindow(QMainWindow):
 
     def __init__(
         self,
+        *,
         uc: UnitCellView,
         uc_plot: UnitCellPlotView,
         bz_plot: BrillouinZonePlotView,
@@ -62,7 +62,6 @@ class MainWindow(QMainWindow):
     ):
         super().__init__()
         self.setWindowTitle("TiBi")
-        # self.setMinimumSize(1100, 825)
 
         # Store references to UI components
         self.uc = uc
@@ -84,21 +83,18 @@ class MainWindow(QMainWindow):
 
         # Create three column Layouts and wrap them into Widgets
         # UnitCell geometry and Sites
-        unit_cell_layout = QVBoxLayout()
-        unit_cell_layout.setContentsMargins(0, 0, 0, 0)
         unit_cell_widget = QWidget()
-        unit_cell_widget.setLayout(unit_cell_layout)
+        unit_cell_layout = QVBoxLayout(unit_cell_widget)
+        unit_cell_layout.setContentsMargins(0, 0, 0, 0)
         unit_cell_widget.setSizePolicy(
             QSizePolicy.Fixed, QSizePolicy.Expanding
         )
         unit_cell_layout.addWidget(self._frame_widget(self.uc))
 
         # Computation controls and BZ
-        computation_layout = QVBoxLayout()
-        computation_layout.setContentsMargins(0, 0, 0, 0)
-
         computation_widget = QWidget()
-        computation_widget.setLayout(computation_layout)
+        computation_layout = QVBoxLayout(computation_widget)
+        computation_layout.setContentsMargins(0, 0, 0, 0)
         computation_widget.setSizePolicy(
             QSizePolicy.Fixed, QSizePolicy.Expanding
         )
@@ -151,23 +147,28 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(plots_splitter)
         # Set as central widget
         self.setCentralWidget(main_view)
+        # Start from a comfortable default size but keep the window
+        # resizable. The layout itself enforces the minimum size. The size
+        # is set once the layout is complete so that it is measured only
+        # against the final geometry.
+        self.resize(1200, 900)
 
     def closeEvent(self, event):
         # Override the parent class closeEvent to emit a signal on closing.
         self.window_closed.emit()
         super().closeEvent(event)
 
-    def _frame_widget(self, widget: QWidget) -> QFrame:
+    def _frame_widget(self, widget: QWidget) -> QWidget:
         """
-        Enclose a widget in a frame.
+        Draw a frame around a widget.
 
-        Used to make the layout look more structured.
+        Used to make the layout look more structured. The border comes from
+        the `panel` property rule of the style sheet, so the widget is not
+        wrapped into an additional container.
         """
-        frame = QFrame()
-        frame.setFrameShape(QFrame.Box)
-        frame.setLineWidth(1)
-        layout = QVBoxLayout()
-        layout.setContentsMargins(5, 5, 5, 5)
-        layout.addWidget(widget, stretch=1)
-        frame.setLayout(layout)
-        return frame
+        widget.setProperty("panel", "framed")
+        widget.setAttribute(Qt.WA_StyledBackground, True)
+        # Leave room for the 1px border and the 5px spacing around the
+        # contents. Contents margins also apply to widgets without a layout.
+        widget.setContentsMargins(6, 6, 6, 6)
+        return widget
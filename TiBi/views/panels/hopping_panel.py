@@ -15,6 +15,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from TiBi.ui.styles import HOPPING_BUTTON_STYLE
 from TiBi.ui.utilities import get_resource_path, set_button_size
 
 
@@ -40,6 +41,8 @@ class HoppingMatrix(QWidget):
 
         # Content widget for grid
         self.content_widget = QWidget()
+        # The buttons select their colors through the "hopping" property
+        self.content_widget.setStyleSheet(HOPPING_BUTTON_STYLE)
         self.grid_layout = QGridLayout(self.content_widget)
         self.grid_layout.setSpacing(3)
 
@@ -49,6 +49,12 @@ class TreeDelegate(QStyledItemDelegate):
         self.add_renderer = QSvgRenderer(
             str(get_resource_path("assets/icons/plus.svg"))
         )
+        # Colors of the "Add Unit Cell" row, built once instead of on
+        # every repaint
+        self.add_uc_background = QColor(
+            *hex_to_rgb(THEME_SETTINGS["PRIMARY_HEX"])
+        )
+        self.add_uc_text = QColor(*hex_to_rgb(THEME_SETTINGS["ON_PRIMARY"]))
 
     def _button_rects(self, option, index):
         """Regions defining the item buttons."""
@@ -102,13 +108,10 @@ class TreeDelegate(QStyledItemDelegate):
             )
 
             # Draw background across the full width
-            painter.fillRect(
-                full_rect,
-                QColor(*hex_to_rgb(THEME_SETTINGS["PRIMARY_HEX"])),
-            )
+            painter.fillRect(full_rect, self.add_uc_background)
 
             # Text formatting
-            painter.setPen(QColor(*hex_to_rgb(THEME_SETTINGS["ON_PRIMARY"])))
+            painter.setPen(self.add_uc_text)
             font = painter.font()
             painter.setFont(font)
 
@@ -259,36 +262,26 @@ class TreeViewPanel(QWidget):
 
         # Set up Delete shortcut
         self.delete_shortcut = QShortcut(QKeySequence("Del"), self.tree_view)
-        self.delete_shortcut.activated.connect(
-            lambda: self.delete_requested.emit()
-        )
+        self.delete_shortcut.activated.connect(self.delete_requested)
 
         # Add Backspace as an alternative shortcut
         self.backspace_shortcut = QShortcut(
             QKeySequence("Backspace"), self.tree_view
         )
-        self.backspace_shortcut.activated.connect(
-            lambda: self.delete_requested.emit()
-        )
+        self.backspace_shortcut.activated.connect(self.delete_requested)
 
         # Relay delegate signals
         self.delegate.delete_requested.connect(
-            lambda: QTimer.singleShot(0, lambda: self.delete_requested.emit())
+            lambda: QTimer.singleShot(0, self.delete_requested.emit)
         )
         self.delegate.new_unit_cell_requested.connect(
-            lambda: QTimer.singleShot(
-                0, lambda: self.new_unit_cell_requested.emit()
-            )
+            lambda: QTimer.singleShot(0, self.new_unit_cell_requested.emit)
         )
         self.delegate.new_site_requested.connect(
-            lambda: QTimer.singleShot(
-                0, lambda: self.new_site_requested.emit()
-            )
+            lambda: QTimer.singleShot(0, self.new_site_requested.emit)
         )
         self.delegate.new_state_requested.connect(
-            lambda: QTimer.singleShot(
-                0, lambda: self.new_state_requested.emit()
-            )
+            lambda: QTimer.singleShot(0, self.new_state_requested.emit)
         )
         self.delegate.name_edit_finished.connect(
             lambda x: QTimer.singleShot(
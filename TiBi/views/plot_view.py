@@ -1,4 +1,4 @@
-from PySide6.QtWidgets import QVBoxLayout, QWidget
+from PySide6.QtWidgets import QSizePolicy, QVBoxLayout, QWidget
 from PySide6.QtCore import QSize
 
 import matplotlib.figure as mpl_fig
@@ -17,11 +17,18 @@ class PlotView(QWidget):
     This widget creates a matplotlib figure embedded in a Qt widget to display
     data as 2D plots. It includes navigation controls for zooming, panning,
     and saving the plot.
+
+    Methods
+    -------
+    request_repaint()
+        Schedule a redraw of the figure.
     """
 
     def __init__(self):
         super().__init__()
-        self.setMinimumHeight(150)
+        # Let the plot stretch with the window above a usable minimum
+        self.setMinimumSize(300, 150)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
         # Setup layout
         layout = QVBoxLayout(self)
@@ -41,5 +48,16 @@ class PlotView(QWidget):
         self.ax = self.figure.add_subplot(111)
         self.ax.grid(True)
 
-        # Initial draw
-        self.canvas.draw()
+        # Schedule the initial draw. It runs from the event loop, once the
+        # window is shown and the canvas has its final size, instead of
+        # rendering the empty figure during startup.
+        self.canvas.draw_idle()
+
+    def request_repaint(self):
+        """
+        Schedule a redraw of the figure.
+
+        The figure is rendered once control returns to the event loop, so
+        several requests made in the meantime result in a single draw.
+        """
+        self.canvas.draw_idle()
@@ -30,10 +30,9 @@ class ProgressDialog(QDialog):
         self.cancel_button = QPushButton("Cancel")
         self.cancel_button.clicked.connect(self.cancel_requested.emit)
 
-        layout = QVBoxLayout()
+        layout = QVBoxLayout(self)
         layout.addWidget(self.progress_bar)
         layout.addWidget(self.cancel_button)
-        self.setLayout(layout)
 
     def update_progress(self, value: int):
         """
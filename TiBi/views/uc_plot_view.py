@@ -1,6 +1,6 @@
 import numpy as np
 import pyqtgraph.opengl as gl
-from PySide6.QtWidgets import QVBoxLayout, QWidget
+from PySide6.QtWidgets import QSizePolicy, QVBoxLayout, QWidget
 
 from TiBi.ui import CF_VERMILLION, CF_GREEN, CF_SKY
 
@@ -22,7 +22,9 @@ class UnitCellPlotView(QWidget):
 
     def __init__(self):
         super().__init__()
-        self.setMinimumHeight(150)
+        # Let the plot stretch with the window above a usable minimum
+        self.setMinimumSize(300, 150)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
         # Setup layout
         layout = QVBoxLayout(self)
@@ -3,7 +3,7 @@ from PySide6.QtGui import QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import QTreeView
 import uuid
 
-from TiBi.models import UnitCell
+from TiBi.models import Site, State, UnitCell
 
 
 class SystemTree(QTreeView):
@@ -38,6 +38,8 @@ class SystemTree(QTreeView):
         Rebuilds the entire tree from the current data model.
     remove_tree_item(uc_id, site_id=None, state_id=None)
         Remove an item from the tree.
+    restore_tree_item(item, uc_id, site_id=None)
+        Add and select a tree item together with its children.
     """
 
     tree_selection_changed = Signal(object)
@@ -81,6 +83,8 @@ class SystemTree(QTreeView):
             Dictionary of `UnitCells`s to be displayed in the tree.
             The keys are UUIDs and the values are `UnitCell` objects.
         """
+        # Suspend repaints while the model is rebuilt
+        self.setUpdatesEnabled(False)
         self.tree_model.clear()
         self.root_node = self.tree_model.invisibleRootItem()
 
@@ -88,26 +92,18 @@ class SystemTree(QTreeView):
         add_item = QStandardItem("+ Add Unit Cell")
         add_item.setData("ADD_UNIT_CELL", Qt.UserRole)  # Special marker
         add_item.setFlags(Qt.ItemIsEnabled)  # Not selectable, but clickable
-        self.root_node.appendRow(add_item)
 
-        # Add unit cells
-        for uc_id, unit_cell in unit_cells.items():
-            unit_cell_item = self._create_tree_item(
-                unit_cell.name, item_id=uc_id
-            )
-            self.root_node.appendRow(unit_cell_item)
-
-            # Add sites for this unit cell
-            for site_id, site in unit_cell.sites.items():
-                site_item = self._create_tree_item(site.name, item_id=site_id)
-                unit_cell_item.appendRow(site_item)
-
-                # Add states for this site
-                for state_id, state in site.states.items():
-                    state_item = self._create_tree_item(
-                        state.name, item_id=state_id
-                    )
-                    site_item.appendRow(state_item)
+        # Add unit cells together with their sites and states. The subtrees
+        # are built detached and inserted in a single call, so that the view
+        # is notified once rather than once per unit cell.
+        self.root_node.appendRows(
+            [add_item]
+            + [
+                self._create_subtree(unit_cell)
+                for unit_cell in unit_cells.values()
+            ]
+        )
+        self.setUpdatesEnabled(True)
 
     def _create_tree_item(
         self, item_name: str, item_id: uuid.UUID
@@ -135,6 +131,31 @@ class SystemTree(QTreeView):
 
         return tree_item
 
+    def _create_subtree(self, item: UnitCell | Site | State) -> QStandardItem:
+        """
+        Create a tree item together with the items of its children.
+
+        Parameters
+        ----------
+        item : UnitCell | Site | State
+            The object to be represented by the tree item.
+
+        Returns
+        -------
+        QStandardItem
+            The new tree item.
+        """
+        tree_item = self._create_tree_item(item.name, item_id=item.id)
+        if isinstance(item, UnitCell):
+            children = item.sites.values()
+        elif isinstance(item, Site):
+            children = item.states.values()
+        else:
+            children = ()
+        for child in children:
+            tree_item.appendRow(self._create_subtree(child))
+        return tree_item
+
     def find_item_by_id(
         self, uc_id, site_id=None, state_id=None
     ) -> QStandardItem | None:
@@ -220,6 +241,38 @@ class SystemTree(QTreeView):
             index, QItemSelectionModel.ClearAndSelect
         )
 
+    def restore_tree_item(
+        self, item: UnitCell | Site | State, uc_id, site_id=None
+    ):
+        """
+        Add and select a tree item together with its children.
+
+        Used to put back a previously removed item without rebuilding the
+        entire tree, which would also collapse all the expanded items.
+
+        Parameters
+        ----------
+        item : UnitCell | Site | State
+            The object to be put back into the tree
+        uc_id : uuid.UUID
+            id of the `UnitCell`
+        site_id : uuid.UUID, optional
+            id of the `Site`
+        """
+        if isinstance(item, State):
+            parent = self.find_item_by_id(uc_id, site_id)
+        elif isinstance(item, Site):
+            parent = self.find_item_by_id(uc_id)
+        else:
+            parent = self.root_node
+
+        tree_item = self._create_subtree(item)
+        parent.appendRow(tree_item)
+        index = self.tree_model.indexFromItem(tree_item)
+        self.selectionModel().setCurrentIndex(
+            index, QItemSelectionModel.ClearAndSelect
+        )
+
     def remove_tree_item(self, uc_id, site_id=None, state_id=None):
         """
         Remove an item from the tree.